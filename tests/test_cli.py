@@ -3,21 +3,16 @@ import argparse
 import sys
 from unittest import mock
 
-# Assuming ServerConfig can be instantiated without side effects for version
-# or we mock its version attribute if needed.
-# For now, let's assume it's okay or mock it if tests fail due to it.
-from the_notebook_mcp.core.config import ServerConfig
 from the_notebook_mcp.cli import parse_arguments, DEFAULT_LOG_DIR, DEFAULT_LOG_LEVEL_STR
 
 # Store the real ArgumentParser before any patching
 RealArgumentParser = argparse.ArgumentParser
 
 
-# Mock the version for consistency in tests
+# Mock the version for consistency in tests (cli.py resolves it via get_version)
 @pytest.fixture(autouse=True)
-def mock_server_config_version():
-    with mock.patch("the_notebook_mcp.cli.ServerConfig") as MockServerConfig:
-        MockServerConfig.return_value.version = "0.1.0-test"
+def mock_get_version():
+    with mock.patch("the_notebook_mcp.core.config.get_version", return_value="0.1.0-test"):
         yield
 
 
@@ -30,6 +25,7 @@ def test_parse_arguments_start_defaults():
     assert args.allow_root_dirs == ["/test/dir"]
     assert args.log_dir == DEFAULT_LOG_DIR
     assert args.log_level == DEFAULT_LOG_LEVEL_STR
+    assert args.file_log_level is None
     assert args.max_cell_source_size == 10 * 1024 * 1024
     assert args.max_cell_output_size == 10 * 1024 * 1024
     assert args.transport == "stdio"
@@ -50,6 +46,8 @@ def test_parse_arguments_start_all_args():
         "/custom/log",
         "--log-level",
         "DEBUG",
+        "--file-log-level",
+        "TRACE",
         "--max-cell-source-size",
         "1000",
         "--max-cell-output-size",
@@ -69,6 +67,7 @@ def test_parse_arguments_start_all_args():
     assert args.allow_root_dirs == ["/test/dir1", "/test/dir2"]
     assert args.log_dir == "/custom/log"
     assert args.log_level == "DEBUG"  # Test case_insensitive_log_level
+    assert args.file_log_level == "TRACE"
     assert args.max_cell_source_size == 1000
     assert args.max_cell_output_size == 2000
     assert args.transport == "sse"
@@ -78,11 +77,12 @@ def test_parse_arguments_start_all_args():
 
 
 def test_parse_arguments_start_log_level_case_insensitive():
-    """Test 'start' command with case-insensitive log level."""
-    test_args = ["start", "--allow-root", "/test/dir", "--log-level", "wArNiNg"]
+    """Test 'start' command with case-insensitive log levels."""
+    test_args = ["start", "--allow-root", "/test/dir", "--log-level", "wArNiNg", "--file-log-level", "dEbUg"]
     with mock.patch.object(sys, "argv", ["prog_name"] + test_args):
         args = parse_arguments()
     assert args.log_level == "WARNING"
+    assert args.file_log_level == "DEBUG"
 
 
 def test_parse_arguments_start_missing_allow_root():
@@ -245,9 +245,9 @@ def test_case_insensitive_log_level_helper():
     assert case_insensitive_log_level("WaRnInG") == "WARNING"
 
 
-# It might be useful to test what happens if ServerConfig raises an error,
-# though this is more about ServerConfig's robustness.
-# For cli.py, the main concern is that ServerConfig().version is accessed.
+# It might be useful to test what happens if get_version raises an error,
+# though this is more about config's robustness.
+# For cli.py, the main concern is that get_version() is accessed.
 
 
 def test_parse_arguments_start_invalid_log_level():
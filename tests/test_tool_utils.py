@@ -3,6 +3,7 @@ from the_notebook_mcp.tools.tool_utils import (
     extract_code_outline,
     extract_markdown_outline,
     get_first_line_context,
+    utf8_size_exceeds,
 )
 
 # --- Tests for extract_code_outline ---
@@ -147,3 +148,47 @@ def test_get_first_line_context_custom_max_lines():
 def test_get_first_line_context_only_one_valid_line():
     source = "# comment\n\nvalid_line\n# comment 2"
     assert get_first_line_context(source) == ["valid_line"]
+
+
+# --- Tests for utf8_size_exceeds ---
+
+
+def test_utf8_size_exceeds_empty_string():
+    assert utf8_size_exceeds("", 0) is False
+    assert utf8_size_exceeds("", 100) is False
+
+
+def test_utf8_size_exceeds_ascii_under_limit():
+    assert utf8_size_exceeds("a" * 10, 100) is False
+
+
+def test_utf8_size_exceeds_ascii_over_limit():
+    assert utf8_size_exceeds("a" * 101, 100) is True
+
+
+def test_utf8_size_exceeds_ascii_exact_boundary():
+    # len == encoded size == limit: not strictly greater, so within budget.
+    assert utf8_size_exceeds("a" * 100, 100) is False
+    assert utf8_size_exceeds("a" * 100, 99) is True
+
+
+def test_utf8_size_exceeds_multibyte_forces_encode_over():
+    # 50 two-byte chars: len (50) <= limit but len * 4 (200) > limit, so the
+    # cheap bounds are inconclusive and the actual encode (100 bytes) decides.
+    assert utf8_size_exceeds("é" * 50, 99) is True
+
+
+def test_utf8_size_exceeds_multibyte_forces_encode_under():
+    # Same ambiguous window, but the 100 encoded bytes fit the limit.
+    assert utf8_size_exceeds("é" * 50, 100) is False
+
+
+def test_utf8_size_exceeds_multibyte_exact_boundary():
+    # 4-byte emoji: 25 chars encode to exactly 100 bytes.
+    assert utf8_size_exceeds("😀" * 25, 100) is False
+    assert utf8_size_exceeds("😀" * 25, 99) is True
+
+
+def test_utf8_size_exceeds_multibyte_short_circuit_under():
+    # len * 4 <= limit: fits even if every char were 4 bytes, no encode needed.
+    assert utf8_size_exceeds("😀" * 25, 100 * 4) is False
@@ -2,61 +2,23 @@ import argparse
 import os
 import sys
 
-from .core.config import ServerConfig
-
 DEFAULT_LOG_DIR = os.path.expanduser("~/.the-notebook-mcp")
 DEFAULT_LOG_LEVEL_STR = "INFO"
 
+LOG_LEVEL_CHOICES = ("TRACE", "DEBUG", "INFO", "SUCCESS", "WARNING", "ERROR", "CRITICAL")
 
-# Helper function for case-insensitive log level
-def case_insensitive_log_level(value: str) -> str:
-    """Convert input log level to uppercase for case-insensitive comparison."""
-    return value.upper()
-
-
-def parse_arguments() -> argparse.Namespace:
-    """Parse command-line arguments for the Jupyter Notebook MCP Server.
-
-    This function sets up the argument parser with subcommands (start, version, help),
-    defines all available arguments, and handles special cases like the help command.
-
-    For the 'start' command, it defines arguments for allowed root directories,
-    logging configuration, cell size limits, and network transport settings.
-
-    Returns:
-        An argparse.Namespace object containing the parsed command-line arguments.
-        If no command is provided or help is requested, the function may exit the process
-        after printing appropriate help text.
-    """
-    parser = argparse.ArgumentParser(
-        description="Jupyter Notebook MCP Server.",
-        # Allow showing help on error for the main parser
-        # add_help=False # If we want very custom error + help
-    )
+# Precomputed lowercase -> canonical level map for case-insensitive matching.
+_LOG_LEVEL_MAP = {level.lower(): level for level in LOG_LEVEL_CHOICES}
 
-    _version_str = ServerConfig().version
-    parser.version = f"%(prog)s {_version_str}"
 
-    parser.add_argument(
-        "-v",
-        "--version",
-        action="version",  # This top-level version flag prints and exits
-        help="Show program's version number and exit.",
-    )
+# Helper function for case-insensitive log level
+def case_insensitive_log_level(value: str) -> str:
+    """Convert input log level to its canonical uppercase form via a precomputed map."""
+    return _LOG_LEVEL_MAP.get(value.lower(), value.upper())
 
-    subparsers = parser.add_subparsers(
-        title="Commands",
-        dest="command",
-        help="Run 'python -m the_notebook_mcp.server <command> --help' for more information on a command.",
-    )
 
-    # --- Start command ---
-    start_parser = subparsers.add_parser(
-        "start",
-        help="Start the Jupyter Notebook MCP server.",
-        description="Run the Jupyter Notebook MCP server with the specified configurations.",
-        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
-    )
+def _add_start_arguments(start_parser: argparse.ArgumentParser) -> None:
+    """Defines the 'start' subcommand arguments on the given parser."""
     start_parser.add_argument(
         "--allow-root",
         dest="allow_root_dirs",
@@ -76,9 +38,16 @@ def parse_arguments() -> argparse.Namespace:
         "--log-level",
         type=case_insensitive_log_level,
         default=DEFAULT_LOG_LEVEL_STR,
-        choices=["TRACE", "DEBUG", "INFO", "SUCCESS", "WARNING", "ERROR", "CRITICAL"],
+        choices=LOG_LEVEL_CHOICES,
         help="Set the console logging level (case-insensitive).",
     )
+    start_parser.add_argument(
+        "--file-log-level",
+        type=case_insensitive_log_level,
+        default=None,
+        choices=LOG_LEVEL_CHOICES,
+        help="Set the file logging level (case-insensitive). Defaults to the console log level.",
+    )
     start_parser.add_argument(
         "--max-cell-source-size",
         type=int,
@@ -121,13 +90,62 @@ def parse_arguments() -> argparse.Namespace:
         metavar="URL_PATH",
         help="URL path for the MCP endpoint (used for HTTP-based transports).",
     )
-    start_parser.set_defaults(command="start")
 
-    # --- Version command ---
-    version_parser = subparsers.add_parser(  # This is the 'version' subcommand
-        "version", help="Show program's version number and exit."
+
+def parse_arguments() -> argparse.Namespace:
+    """Parse command-line arguments for the Jupyter Notebook MCP Server.
+
+    This function sets up the argument parser with subcommands (start, version, help),
+    defines all available arguments, and handles special cases like the help command.
+
+    For the 'start' command, it defines arguments for allowed root directories,
+    logging configuration, cell size limits, and network transport settings.
+
+    Returns:
+        An argparse.Namespace object containing the parsed command-line arguments.
+        If no command is provided or help is requested, the function may exit the process
+        after printing appropriate help text.
+    """
+    parser = argparse.ArgumentParser(
+        description="Jupyter Notebook MCP Server.",
+        # Allow showing help on error for the main parser
+        # add_help=False # If we want very custom error + help
+    )
+
+    # Imported lazily so that bare invocations (e.g. --help) skip loading core.config.
+    from .core.config import get_version
+
+    parser.version = f"%(prog)s {get_version()}"
+
+    parser.add_argument(
+        "-v",
+        "--version",
+        action="version",  # This top-level version flag prints and exits
+        help="Show program's version number and exit.",
     )
-    version_parser.set_defaults(command="version")
+
+    subparsers = parser.add_subparsers(
+        title="Commands",
+        dest="command",
+        help="Run 'python -m the_notebook_mcp.server <command> --help' for more information on a command.",
+    )
+
+    # --- Start command ---
+    start_parser = subparsers.add_parser(
+        "start",
+        help="Start the Jupyter Notebook MCP server.",
+        description="Run the Jupyter Notebook MCP server with the specified configurations.",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    # The heavyweight start arguments are only materialized when this
+    # invocation can actually reach them ('start' itself, or 'help start');
+    # bare --help and the other subcommands only need the parser to exist in
+    # the subcommand choices list.
+    if "start" in sys.argv[1:3]:
+        _add_start_arguments(start_parser)
+
+    # --- Version command ---
+    subparsers.add_parser("version", help="Show program's version number and exit.")
 
     # --- Help command ---
     help_parser = subparsers.add_parser(
@@ -148,7 +166,6 @@ def parse_arguments() -> argparse.Namespace:
         action="store_true",
         help="Show program's version number and exit (when used with the 'help' command).",
     )
-    help_parser.set_defaults(command="help")
 
     # --- Argument parsing and help subcommand logic ---
 
@@ -13,24 +13,42 @@ Handles server branding, including ASCII art and startup messages.
 from the_notebook_mcp.core.config import ServerConfig
 
 
+# The banner is a pure constant, so it is rendered once at import time
+# rather than rebuilt for every startup message request.
+_BLUE = "fg #3776AB"
+_ORANGE = "fg #e46e2e"
+_BANNER = {
+    "width": 59,
+    "text": "\n".join(
+        [
+            "",
+            f"<{_BLUE}>         </{_BLUE}><{_ORANGE}>▗▖  ▗▖ ▗▄▖ ▗▄▄▄▖▗▄▄▄▖▗▄▄▖  ▗▄▖  ▗▄▖ ▗▖ ▗▖</{_ORANGE}><{_BLUE}>         </{_BLUE}>",
+            f"<{_BLUE}>┏┳┓┓     </{_BLUE}><{_ORANGE}>▐▛▚▖▐▌▐▌ ▐▌  █  ▐▌   ▐▌ ▐▌▐▌ ▐▌▐▌ ▐▌▐▌▗▞▘</{_ORANGE}><{_BLUE}>  ┳┳┓┏┓┏┓</{_BLUE}>",
+            f"<{_BLUE}> ┃ ┣┓┏┓  </{_BLUE}><{_ORANGE}>▐▌ ▝▜▌▐▌ ▐▌  █  ▐▛▀▀▘▐▛▀▚▖▐▌ ▐▌▐▌ ▐▌▐▛▚▖ </{_ORANGE}><{_BLUE}>  ┃┃┃┃ ┃┃</{_BLUE}>",
+            f"<{_BLUE}> ┻ ┛┗┗   </{_BLUE}><{_ORANGE}>▐▌  ▐▌▝▚▄▞▘  █  ▐▙▄▄▖▐▙▄▞▘▝▚▄▞▘▝▚▄▞▘▐▌ ▐▌</{_ORANGE}><{_BLUE}>  ┛ ┗┗┛┣┛</{_BLUE}>",
+        ]
+    ),
+}
+
+
+# Connection-box pieces derived from the fixed banner width; built once
+# instead of repeating the string multiplications on every render.
+_BOX_WIDTH = _BANNER["width"] - 2
+_BOX_BORDER = "─" * _BOX_WIDTH
+_BOX_BLANK = " " * _BOX_WIDTH
+
+# Rendered startup messages keyed by the config fields they depend on.
+# The config is immutable after construction, so a repeat render with the
+# same settings returns the cached string.
+_startup_message_cache: dict = {}
+
+
 def get_ascii_banner() -> dict:
     """
-    Generates a colored ASCII art banner for "The Notebook MCP".
+    Returns the colored ASCII art banner for "The Notebook MCP".
     Uses Loguru color tags and Python logo colors.
     """
-
-    blue = "fg #3776AB"
-
-    orange = "fg #e46e2e"
-    banner_lines = [
-        "",
-        f"<{blue}>         </{blue}><{orange}>▗▖  ▗▖ ▗▄▖ ▗▄▄▄▖▗▄▄▄▖▗▄▄▖  ▗▄▖  ▗▄▖ ▗▖ ▗▖</{orange}><{blue}>         </{blue}>",
-        f"<{blue}>┏┳┓┓     </{blue}><{orange}>▐▛▚▖▐▌▐▌ ▐▌  █  ▐▌   ▐▌ ▐▌▐▌ ▐▌▐▌ ▐▌▐▌▗▞▘</{orange}><{blue}>  ┳┳┓┏┓┏┓</{blue}>",
-        f"<{blue}> ┃ ┣┓┏┓  </{blue}><{orange}>▐▌ ▝▜▌▐▌ ▐▌  █  ▐▛▀▀▘▐▛▀▚▖▐▌ ▐▌▐▌ ▐▌▐▛▚▖ </{orange}><{blue}>  ┃┃┃┃ ┃┃</{blue}>",
-        f"<{blue}> ┻ ┛┗┗   </{blue}><{orange}>▐▌  ▐▌▝▚▄▞▘  █  ▐▙▄▄▖▐▙▄▞▘▝▚▄▞▘▝▚▄▞▘▐▌ ▐▌</{orange}><{blue}>  ┛ ┗┗┛┣┛</{blue}>",
-    ]
-
-    return {"width": 59, "text": "\n".join(banner_lines)}
+    return _BANNER
 
 
 def get_server_startup_message(config: ServerConfig = None) -> str:
@@ -47,6 +65,17 @@ def get_server_startup_message(config: ServerConfig = None) -> str:
         Formatted startup message string
     """
 
+    cache_key = (
+        config.version,
+        config.transport,
+        config.host,
+        config.port,
+        tuple(config.allow_root_dirs),
+    )
+    cached = _startup_message_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     banner = get_ascii_banner()
 
     # Center version string after the banner
@@ -54,33 +83,38 @@ def get_server_startup_message(config: ServerConfig = None) -> str:
     padding_left = (banner["width"] - len(version_str)) // 2
     centered_version = " " * padding_left + version_str
 
-    box_width = banner["width"] - 2
-    directories = "\n".join(
-        [f"│  - {dir_path} {'':<{box_width - len(dir_path) - 5}}│" for dir_path in config.allow_root_dirs]
-    )
+    box_width = _BOX_WIDTH
+    directories = "\n".join("│" + f"  - {dir_path}".ljust(box_width) + "│" for dir_path in config.allow_root_dirs)
 
     # Format connection information based on transport
     if config.transport == "stdio":
+        exit_hint = "Press Ctrl+D to exit".rjust(34)
+        dirs_header = " root directories:".ljust(box_width)
         connection_box = f"""
-╭{"─" * box_width}╮
-│ <green>Server running</green> <dim>stdio</dim> <yellow>{"Press Ctrl+D to exit":>34}</yellow> │
-│{" " * box_width}│
-│{" root directories:":<{box_width}}│
+╭{_BOX_BORDER}╮
+│ <green>Server running</green> <dim>stdio</dim> <yellow>{exit_hint}</yellow> │
+│{_BOX_BLANK}│
+│{dirs_header}│
 {directories}
-╰{"─" * box_width}╯
+╰{_BOX_BORDER}╯
 """
     else:
         # HTTP-based transports (streamable-http or sse)
         url = f"http://{config.host}:{config.port}"
         transport_name = "Streamable HTTP" if config.transport == "streamable-http" else "SSE"
+        exit_hint = "Press <lr>Ctrl+C</lr> to exit".rjust(box_width - len(transport_name) - 9)
+        url_padding = " " * (box_width - len(url) - 8)
+        dirs_padding = " " * (box_width - 20)
         connection_box = f"""
-╭{"─" * box_width}╮
-│ <green>Server running</green> <dim>{transport_name}</dim> <yellow>{"Press <lr>Ctrl+C</lr> to exit":>{box_width - len(transport_name) - 9}}</yellow> │
-│ URL: <underline>{url}</underline> {"":<{box_width - len(url) - 8}} │
-│{" " * box_width}│
-│ root directories: {"":<{box_width - 20}} │
+╭{_BOX_BORDER}╮
+│ <green>Server running</green> <dim>{transport_name}</dim> <yellow>{exit_hint}</yellow> │
+│ URL: <underline>{url}</underline> {url_padding} │
+│{_BOX_BLANK}│
+│ root directories: {dirs_padding} │
 {directories}
-╰{"─" * box_width}╯
+╰{_BOX_BORDER}╯
 """
 
-    return f"{banner['text']}\n<magenta>{centered_version}</magenta>\n{connection_box}\n"
+    message = f"{banner['text']}\n<magenta>{centered_version}</magenta>\n{connection_box}\n"
+    _startup_message_cache[cache_key] = message
+    return message
@@ -6,6 +6,18 @@ import argparse
 
 from .. import __version__
 
+# Sentinel distinguishing "attribute absent" from legitimate falsy values.
+_MISSING = object()
+
+
+def get_version() -> str:
+    """Returns the package version string.
+
+    Lets callers that only need the version (e.g. the CLI's version
+    commands) skip constructing a full ServerConfig.
+    """
+    return __version__.__version__
+
 
 class ServerConfig:
     """
@@ -18,6 +30,7 @@ class ServerConfig:
         max_cell_output_size (int): Maximum allowed size (bytes) for cell output.
         log_dir (str): Directory for log files.
         log_level (str): Logging level string.
+        file_log_level (Optional[str]): Logging level for the log file; falls back to log_level.
         transport (str): Transport protocol to use (stdio, streamable-http, sse).
         host (str): Host to bind to (default: 0.0.0.0), used for HTTP transports.
         port (int): Port to bind to (default: 8889), used for HTTP transports.
@@ -25,7 +38,24 @@ class ServerConfig:
         command (str): Command for the server.
     """
 
-    VALID_TRANSPORTS = ["stdio", "streamable-http", "sse"]
+    VALID_TRANSPORTS = frozenset({"stdio", "streamable-http", "sse"})
+
+    # Directories that already passed the isdir check; repeated config
+    # construction skips re-statting them.
+    _validated_dirs: set = set()
+
+    # Namespace attributes copied verbatim onto the config when present.
+    _ARG_FIELDS = (
+        "max_cell_source_size",
+        "max_cell_output_size",
+        "log_dir",
+        "log_level",
+        "file_log_level",
+        "transport",
+        "host",
+        "port",
+        "path",
+    )
 
     def __init__(self, args: Optional[argparse.Namespace] = None):
         """
@@ -42,10 +72,12 @@ class ServerConfig:
         self.max_cell_output_size = 10 * 1024 * 1024  # 10 MiB
         self.log_dir = os.path.expanduser("~/.the-notebook-mcp")
         self.log_level = "INFO"
+        self.file_log_level = None
         self.transport = "stdio"
         self.host = "0.0.0.0"
         self.port = 8889
         self.path = "/mcp"
+        self._run_kwargs = None
 
         if args:
             if hasattr(args, "command"):
@@ -61,34 +93,16 @@ class ServerConfig:
             args: Parsed command-line arguments.
         """
 
-        if hasattr(args, "allow_root_dirs"):
-            self.allow_root_dirs = args.allow_root_dirs
-        elif hasattr(args, "allow_root"):
-            self.allow_root_dirs = args.allow_root
-
-        if hasattr(args, "max_cell_source_size"):
-            self.max_cell_source_size = args.max_cell_source_size
-
-        if hasattr(args, "max_cell_output_size"):
-            self.max_cell_output_size = args.max_cell_output_size
-
-        if hasattr(args, "log_dir"):
-            self.log_dir = args.log_dir
+        allow_root_dirs = getattr(args, "allow_root_dirs", _MISSING)
+        if allow_root_dirs is _MISSING:
+            allow_root_dirs = getattr(args, "allow_root", _MISSING)
+        if allow_root_dirs is not _MISSING:
+            self.allow_root_dirs = allow_root_dirs
 
-        if hasattr(args, "log_level"):
-            self.log_level = args.log_level
-
-        if hasattr(args, "transport"):
-            self.transport = args.transport
-
-        if hasattr(args, "host"):
-            self.host = args.host
-
-        if hasattr(args, "port"):
-            self.port = args.port
-
-        if hasattr(args, "path"):
-            self.path = args.path
+        for name in self._ARG_FIELDS:
+            value = getattr(args, name, _MISSING)
+            if value is not _MISSING:
+                setattr(self, name, value)
 
     def _validate(self):
         """
@@ -108,8 +122,10 @@ class ServerConfig:
                 if not os.path.isabs(dir_path):
                     raise ValueError(f"--allow-root must be an absolute path: {dir_path}")
 
-                if not os.path.isdir(dir_path):
-                    raise ValueError(f"--allow-root directory does not exist: {dir_path}")
+                if dir_path not in self._validated_dirs:
+                    if not os.path.isdir(dir_path):
+                        raise ValueError(f"--allow-root directory does not exist: {dir_path}")
+                    self._validated_dirs.add(dir_path)
 
         if self.max_cell_source_size <= 0:
             raise ValueError(f"--max-cell-source-size must be positive: {self.max_cell_source_size}")
@@ -118,9 +134,11 @@ class ServerConfig:
             raise ValueError(f"--max-cell-output-size must be positive: {self.max_cell_output_size}")
 
         if self.transport not in self.VALID_TRANSPORTS:
-            raise ValueError(f"Invalid transport: {self.transport}. Must be one of {', '.join(self.VALID_TRANSPORTS)}")
+            raise ValueError(
+                f"Invalid transport: {self.transport}. Must be one of {', '.join(sorted(self.VALID_TRANSPORTS))}"
+            )
 
-        if self.transport in ["streamable-http", "sse"]:
+        if self.transport in ("streamable-http", "sse"):
             if not 1 <= self.port <= 65535:
                 raise ValueError(f"Port must be between 1 and 65535, got {self.port}")
 
@@ -135,29 +153,22 @@ class ServerConfig:
             A dictionary of kwargs to pass to FastMCP.run().
         """
 
-        kwargs = {}
+        if self._run_kwargs is not None:
+            return self._run_kwargs
 
         if self.transport == "stdio":
-            kwargs["transport"] = "stdio"
-        elif self.transport == "streamable-http":
-            kwargs.update(
-                {
-                    "transport": "streamable-http",
-                    "host": self.host,
-                    "port": self.port,
-                    "path": self.path,
-                    "log_level": self.log_level.lower(),
-                }
-            )
-        elif self.transport == "sse":
-            kwargs.update(
-                {
-                    "transport": "sse",
-                    "host": self.host,
-                    "port": self.port,
-                    "path": self.path,
-                    "log_level": self.log_level.lower(),
-                }
-            )
-
+            kwargs = {"transport": "stdio"}
+        elif self.transport in ("streamable-http", "sse"):
+            kwargs = {
+                "transport": self.transport,
+                "host": self.host,
+                "port": self.port,
+                "path": self.path,
+                "log_level": self.log_level.lower(),
+            }
+        else:
+            kwargs = {}
+
+        # Config is immutable after construction, so the dict is built once.
+        self._run_kwargs = kwargs
         return kwargs
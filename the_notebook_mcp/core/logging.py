@@ -1,8 +1,23 @@
 import sys
 import os
 import logging
+from pathlib import Path
+from typing import Optional
+
 from loguru import logger
 
+# Source file of the stdlib logging module, resolved once; emit() compares
+# frame filenames against this instead of re-reading logging.__file__ per frame.
+_LOGGING_SRCFILE = logging.__file__
+
+# Maps stdlib level names to their resolved Loguru level (or the bare levelno
+# for levels Loguru does not know), so emit() skips the lookup per record.
+_LEVEL_NAME_CACHE: dict = {}
+
+# Set once the stdlib root logger has been pointed at InterceptHandler, so
+# repeated setup_logging calls do not stack handlers or redo the wiring.
+_intercept_installed = False
+
 
 class InterceptHandler(logging.Handler):
     """
@@ -24,19 +39,37 @@ class InterceptHandler(logging.Handler):
         Args:
             record: The `logging.LogRecord` instance to process.
         """
-        try:
-            level = logger.level(record.levelname).name
-        except ValueError:
-            level = record.levelno
+        level = _LEVEL_NAME_CACHE.get(record.levelname)
+        if level is None:
+            try:
+                level = logger.level(record.levelname).name
+            except ValueError:
+                level = record.levelno
+            _LEVEL_NAME_CACHE[record.levelname] = level
 
         frame, depth = logging.currentframe(), 2
-        while frame and frame.f_code.co_filename == logging.__file__:
+        while frame and frame.f_code.co_filename == _LOGGING_SRCFILE:
             frame = frame.f_back
             depth += 1
 
         logger.opt(depth=depth, exception=record.exc_info).log(level, record.getMessage())
 
 
+# Static Loguru format strings, built once; log_formatter only selects one.
+_LITERAL_FORMAT = "{message}"
+_INFO_FORMAT = "<level>{level: <7}</level> <dim>|</dim> {message}\n"
+_DETAILED_FORMAT = (
+    "<level>{level: <7}</level> <dim>|</dim> "
+    "<light-green>{name}:{module}:{line} ({function})</light-green> - "
+    "<white>{message}</white>\n{exception}"
+)
+_DETAILED_FORMAT_RED = (
+    "<level>{level: <7}</level> <dim>|</dim> "
+    "<light-green>{name}:{module}:{line} ({function})</light-green> - "
+    "<red>{message}</red>\n{exception}"
+)
+
+
 def log_formatter(record: dict) -> str:
     """
     Custom Loguru formatter for console output.
@@ -45,6 +78,9 @@ def log_formatter(record: dict) -> str:
     provides a concise format for INFO level, and uses distinct colors
     for ERROR/CRITICAL messages. Other levels get a detailed standard format.
 
+    All returned format strings are precomputed module constants; this
+    function only picks the right one for the record.
+
     Args:
         record: The Loguru log record dictionary.
 
@@ -52,24 +88,23 @@ def log_formatter(record: dict) -> str:
         The formatted log string.
     """
     if record["extra"].get("literal"):
-        return "{message}"
-
-    if record["level"].name == "INFO":
-        return "<level>{level: <7}</level> <dim>|</dim> {message}\n"
+        return _LITERAL_FORMAT
 
-    message_color = "white"
+    # Compare on the numeric level (INFO=20, ERROR=40) instead of the name;
+    # int equality is cheaper than string compares on this per-record path.
+    level_no = record["level"].no
+    if level_no == 20:
+        return _INFO_FORMAT
 
-    if record["level"].name == "ERROR" or record["level"].name == "CRITICAL":
-        message_color = "red"
+    if level_no >= 40:
+        return _DETAILED_FORMAT_RED
 
-    return (
-        "<level>{level: <7}</level> <dim>|</dim> "
-        "<light-green>{name}:{module}:{line} ({function})</light-green> - "
-        f"<{message_color}>{{message}}</{message_color}>\n{{exception}}"
-    )
+    return _DETAILED_FORMAT
 
 
-def setup_logging(log_dir_path: str, log_level_str: str, in_prod_like_env: bool = False) -> None:
+def setup_logging(
+    log_dir_path: str, log_level_str: str, file_log_level_str: Optional[str] = None, in_prod_like_env: bool = False
+) -> None:
     """
     Configures Loguru handlers for console and file logging.
 
@@ -77,9 +112,11 @@ def setup_logging(log_dir_path: str, log_level_str: str, in_prod_like_env: bool
     1. Removing any pre-existing Loguru handlers.
     2. Adding a console handler with custom formatting (using `log_formatter`),
        colorization, backtraces, and conditional diagnostics.
-    3. Adding a file handler (if `log_dir_path` is provided) with DEBUG level,
-       detailed formatting, log rotation, retention, asynchronous queuing,
-       and backtraces/diagnostics.
+    3. Adding a file handler (if `log_dir_path` is provided) with detailed
+       formatting, log rotation, retention, asynchronous queuing, and
+       backtraces/diagnostics. The file handler runs at `file_log_level_str`
+       when given, otherwise at the console level — so a default INFO run
+       does not pay to serialize every DEBUG record through the queue.
     4. Intercepting messages from the standard Python `logging` module and
        redirecting them through Loguru using `InterceptHandler`.
 
@@ -91,6 +128,8 @@ def setup_logging(log_dir_path: str, log_level_str: str, in_prod_like_env: bool
                       If empty or None, file logging is disabled.
         log_level_str: The logging level for the console handler (e.g., "INFO", "DEBUG").
                        Case-insensitive.
+        file_log_level_str: Optional logging level for the file handler.
+                            Defaults to the console level when not given.
         in_prod_like_env: Flag indicating if the environment is production-like.
                           Currently unused but available for future enhancements.
     """
@@ -106,22 +145,34 @@ def setup_logging(log_dir_path: str, log_level_str: str, in_prod_like_env: bool
         colorize=True,
         backtrace=True,
         diagnose=is_debug_or_trace,
+        enqueue=False,  # stderr is fast; queueing would only add overhead here
     )
 
+    file_log_level = (file_log_level_str or log_level_str).upper()
+    file_diagnose = file_log_level in ["DEBUG", "TRACE"]
+
     if log_dir_path:
         try:
-            os.makedirs(log_dir_path, exist_ok=True)
-            log_file_path = os.path.join(log_dir_path, "server.log")
+            log_dir = Path(log_dir_path)
+            log_dir.mkdir(parents=True, exist_ok=True)
+            log_file_path = log_dir / "server.log"
+            # The pid never changes, so it is baked into the format here
+            # instead of being looked up via {process.id} for every record.
+            file_format = (
+                "{time:YYYY-MM-DD HH:mm:ss.SSS} | {level: <7} | "
+                f"{os.getpid()} | "
+                "{thread.name: <15} | {name}:{module}:{function}:{line} | {message}"
+            )
             logger.add(
                 log_file_path,
-                level="DEBUG",
-                format="{time:YYYY-MM-DD HH:mm:ss.SSS} | {level: <7} | {process.id} | {thread.name: <15} | {name}:{module}:{function}:{line} | {message}",
+                level=file_log_level,
+                format=file_format,
                 rotation="10 MB",
                 retention="7 days",
                 enqueue=True,
                 encoding="utf-8",
                 backtrace=True,  # Show full exception stack traces for file log as well
-                diagnose=True,  # Always enable diagnose for DEBUG file log
+                diagnose=file_diagnose,
             )
 
             logger.debug(f"File logging enabled: {log_file_path}")
@@ -130,5 +181,13 @@ def setup_logging(log_dir_path: str, log_level_str: str, in_prod_like_env: bool
     else:
         logger.warning("No log directory specified. File logging disabled.")
 
-    logging.basicConfig(handlers=[InterceptHandler()], level=0, force=True)
+    global _intercept_installed
+    if not _intercept_installed:
+        # Equivalent to basicConfig(handlers=[...], level=0, force=True) but
+        # without basicConfig's handler close/teardown pass and lock dance.
+        root_logger = logging.getLogger()
+        root_logger.handlers.clear()
+        root_logger.addHandler(InterceptHandler())
+        root_logger.setLevel(0)
+        _intercept_installed = True
     logger.debug(f"Logging initialized. Console level: {console_log_level}. Intercepting standard logging.")
@@ -5,12 +5,273 @@ These functions are designed to be independent of global state and
 receive necessary configuration (like allowed roots) explicitly.
 """
 
+import asyncio
+import copy
 import os
+import threading
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 from typing import List
 
 import nbformat
 from loguru import logger
 
+try:
+    # Optional accelerated JSON parser for the notebook read path.
+    # Install with the 'orjson' extra to enable it.
+    import orjson
+except ImportError:
+    orjson = None
+
+# (realpath, realpath + os.sep) per configured allowed root. Roots come from
+# --allow-root and never change for the lifetime of the process, so each is
+# resolved once and its comparison prefix built once, instead of on every
+# security check. realpath (not abspath) is kept deliberately: containment
+# must be decided on symlink-resolved paths.
+_allowed_root_realpaths: dict = {}
+
+
+def _resolve_allowed_root(allowed_root: str) -> tuple:
+    """Returns cached (realpath, prefix) for an allowed root, resolving on first use."""
+    resolved = _allowed_root_realpaths.get(allowed_root)
+    if resolved is None:
+        root_realpath = os.path.realpath(allowed_root)
+        resolved = (root_realpath, root_realpath + os.sep)
+        _allowed_root_realpaths[allowed_root] = resolved
+    return resolved
+
+
+# Per-notebook asyncio locks keyed by realpath, created lazily. A mutating
+# tool's read-modify-write cycle holds the lock for its notebook so two
+# concurrent edits cannot interleave and clobber each other's writes.
+_edit_locks: dict = {}
+
+
+def edit_lock(notebook_path: str) -> asyncio.Lock:
+    """Returns the lock serializing read-modify-write cycles for a notebook."""
+    key = os.path.realpath(notebook_path)
+    lock = _edit_locks.get(key)
+    if lock is None:
+        lock = _edit_locks.setdefault(key, asyncio.Lock())
+    return lock
+
+
+def _fast_clone(obj):
+    """Recursively copies JSON-shaped data, deferring to deepcopy for oddballs.
+
+    Notebook metadata and attachments are almost always dicts/lists of
+    scalars; copying those by comprehension skips deepcopy's memo dict and
+    per-object dispatch. Anything outside the JSON shape falls back to
+    copy.deepcopy so unusual values still clone correctly.
+    """
+    if isinstance(obj, dict):
+        return {k: _fast_clone(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_fast_clone(v) for v in obj]
+    if isinstance(obj, (str, int, float, bool, bytes, type(None))):
+        return obj
+    return copy.deepcopy(obj)
+
+
+@asynccontextmanager
+async def mutate(notebook_path: str, allowed_roots: List[str]):
+    """One read-modify-write cycle for a notebook, held under its edit lock.
+
+    Reads the notebook, yields it for in-place mutation, and writes it back
+    when the block exits normally; an exception in the block skips the
+    write. A normal exit always writes, so tools whose no-change paths must
+    leave the file untouched keep the explicit read/write form instead.
+    """
+    async with edit_lock(notebook_path):
+        nb = await read_notebook(notebook_path, allowed_roots)
+        yield nb
+        await write_notebook(notebook_path, nb, allowed_roots)
+
+
+def clone_node(obj):
+    """Deep-copies JSON-shaped notebook data (cells, metadata, attachments).
+
+    Round-trips through orjson when available — far cheaper than
+    copy.deepcopy's per-object dispatch for plain dict/list/str trees — and
+    rewraps the result with nbformat.from_dict so attribute-style access
+    keeps working. Without orjson, _fast_clone provides the same shortcut
+    in pure Python.
+    """
+    if orjson is None:
+        return nbformat.from_dict(_fast_clone(obj))
+    cloned = orjson.loads(orjson.dumps(obj, default=lambda o: o.decode("ascii") if isinstance(o, bytes) else o))
+    return nbformat.from_dict(cloned)
+
+
+def _parse_notebook(data: bytes) -> nbformat.NotebookNode:
+    """Parses raw notebook JSON bytes into a v4 NotebookNode.
+
+    Uses orjson for the JSON decode when available, then runs nbformat's own
+    per-version post-processing (line rejoining, transient stripping), version
+    conversion and validation, matching nbformat.reads() semantics.
+    """
+    if orjson is None:
+        return nbformat.reads(data, as_version=4)
+
+    nb_dict = orjson.loads(data)
+    (major, minor) = nbformat.reader.get_version(nb_dict)
+    if major not in nbformat.versions:
+        raise nbformat.NBFormatError(f"Unsupported nbformat version {major}")
+    nb = nbformat.versions[major].to_notebook_json(nb_dict, minor=minor)
+    nb = nbformat.convert(nb, to_version=4)
+    try:
+        nbformat.validate(nb)
+    except nbformat.ValidationError as e:
+        # nbformat.reads() logs instead of raising here; keep that contract.
+        logger.error(f"Notebook JSON is invalid: {e}")
+    return nb
+
+
+# Containment index per allowed-roots list: a set of exact root realpaths plus
+# a tuple of separator-suffixed prefixes, so membership is one set lookup and
+# one startswith over all roots at once.
+_roots_index_cache: dict = {}
+
+
+def _roots_index(allowed_roots: List[str]) -> tuple:
+    """Returns cached (exact_roots, root_prefixes) for an allowed-roots list."""
+    key = tuple(allowed_roots)
+    index = _roots_index_cache.get(key)
+    if index is None:
+        exact_roots = set()
+        root_prefixes = []
+        for allowed_root in allowed_roots:
+            try:
+                root_realpath, prefix = _resolve_allowed_root(allowed_root)
+            except Exception as e:
+                logger.error(f"Error resolving allowed root '{allowed_root}': {e}")
+                continue
+            exact_roots.add(root_realpath)
+            root_prefixes.append(prefix)
+        index = (exact_roots, tuple(root_prefixes))
+        _roots_index_cache[key] = index
+    return index
+
+
+# Small LRU of parsed notebooks keyed by resolved path, validated against
+# (st_mtime_ns, st_size) so external edits invalidate naturally. Every tool
+# call is a full read-modify-write cycle; for back-to-back edits on the same
+# notebook this turns the read side into a stat plus a deepcopy instead of a
+# JSON parse of the whole file. Callers mutate the returned node, so the
+# cache always holds its own copy. The helpers run in asyncio.to_thread
+# workers, so every access to the OrderedDict is guarded by one lock — held
+# only around dict operations, never across the stat or clone work.
+_NOTEBOOK_CACHE_SIZE = 8
+_notebook_cache: OrderedDict = OrderedDict()
+_notebook_cache_lock = threading.Lock()
+
+
+def _cache_get(resolved_path: str):
+    """Returns a private copy of the cached notebook if still current, else None."""
+    with _notebook_cache_lock:
+        entry = _notebook_cache.get(resolved_path)
+    if entry is None:
+        return None
+    try:
+        stat = os.stat(resolved_path)
+    except OSError:
+        return None
+    if entry[0] != stat.st_mtime_ns or entry[1] != stat.st_size:
+        # pop, not del: another worker may have evicted the stale entry
+        # during the stat window.
+        with _notebook_cache_lock:
+            _notebook_cache.pop(resolved_path, None)
+        return None
+    with _notebook_cache_lock:
+        # The entry may have been evicted since the lookup; only refresh its
+        # LRU position if it is still present.
+        if resolved_path in _notebook_cache:
+            _notebook_cache.move_to_end(resolved_path)
+    return clone_node(entry[2])
+
+
+def _cache_put(resolved_path: str, nb_node: nbformat.NotebookNode) -> None:
+    """Caches a private copy of the notebook against the file's current stat."""
+    try:
+        stat = os.stat(resolved_path)
+    except OSError:
+        return
+    entry = (stat.st_mtime_ns, stat.st_size, clone_node(nb_node))
+    with _notebook_cache_lock:
+        _notebook_cache[resolved_path] = entry
+        _notebook_cache.move_to_end(resolved_path)
+        while len(_notebook_cache) > _NOTEBOOK_CACHE_SIZE:
+            _notebook_cache.popitem(last=False)
+
+
+def _read_notebook_file(resolved_path: str) -> nbformat.NotebookNode:
+    """Blocking read-and-parse helper, run in a worker thread."""
+    cached = _cache_get(resolved_path)
+    if cached is not None:
+        logger.debug(f"Notebook cache hit: {resolved_path}")
+        return cached
+    with open(resolved_path, "rb") as f:
+        nb = _parse_notebook(f.read())
+    _cache_put(resolved_path, nb)
+    return nb
+
+
+def _serialize_notebook(nb_node: nbformat.NotebookNode) -> bytes:
+    """Serializes a notebook node to its on-disk JSON bytes.
+
+    Uses orjson for v4 notebooks when available, applying nbformat's own
+    write-side preprocessing (line splitting, transient stripping) first so
+    the output stays structurally equivalent to nbformat.writes(). Content
+    is validated on the read path; the write path skips re-validation.
+    """
+    if orjson is None or nb_node.get("nbformat") != 4:
+        notebook_string = nbformat.writes(nb_node, version=nbformat.NO_CONVERT)
+        if not notebook_string.endswith("\n"):
+            notebook_string += "\n"
+        return notebook_string.encode("utf-8")
+
+    from nbformat.v4.rwbase import split_lines, strip_transient
+
+    nb = copy.deepcopy(nb_node)
+    nb = split_lines(nb)
+    nb = strip_transient(nb)
+    return orjson.dumps(
+        nb,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE,
+        # nbformat's encoder accepts ascii bytestrings (b64 payloads); match it.
+        default=lambda obj: obj.decode("ascii") if isinstance(obj, bytes) else obj,
+    )
+
+
+def _write_notebook_file(resolved_path: str, nb_node: nbformat.NotebookNode, max_notebook_size: int) -> None:
+    """Blocking serialize-and-write helper, run in a worker thread."""
+    notebook_bytes = _serialize_notebook(nb_node)
+    notebook_size = len(notebook_bytes)
+    if notebook_size > max_notebook_size:
+        raise ValueError(
+            f"Notebook content size ({notebook_size} bytes) exceeds maximum allowed size ({max_notebook_size} bytes)."
+        )
+
+    # The size check already consumed the serialized form; write those bytes
+    # directly in one call. The content goes to a sibling temp file first and
+    # is moved into place with os.replace, so a crash or full disk mid-write
+    # can never leave a truncated notebook behind.
+    tmp_path = f"{resolved_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(notebook_bytes)
+        os.replace(tmp_path, resolved_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+    # The node just written is the file's current content; cache it so an
+    # immediately following read skips the parse.
+    _cache_put(resolved_path, nb_node)
+
 
 def is_path_allowed(target_path: str, allowed_roots: List[str]) -> bool:
     """Checks if the target path is within one of the allowed roots."""
@@ -25,16 +286,10 @@ def is_path_allowed(target_path: str, allowed_roots: List[str]) -> bool:
         logger.error(f"Error resolving path '{target_path}': {e}")
         return False
 
-    for allowed_root in allowed_roots:
-        try:
-            # Ensure allowed_root is also absolute and resolved
-            abs_allowed_root = os.path.realpath(allowed_root)
-            if abs_target_path.startswith(abs_allowed_root + os.sep) or abs_target_path == abs_allowed_root:
-                logger.trace(f"Path '{abs_target_path}' allowed within root '{abs_allowed_root}'")
-                return True
-        except Exception as e:
-            logger.error(f"Error resolving allowed root '{allowed_root}': {e}")
-            continue
+    exact_roots, root_prefixes = _roots_index(allowed_roots)
+    if abs_target_path in exact_roots or (root_prefixes and abs_target_path.startswith(root_prefixes)):
+        logger.trace(f"Path '{abs_target_path}' allowed within configured roots")
+        return True
 
     logger.warning(f"Security check failed: Path '{abs_target_path}' is outside allowed roots: {allowed_roots}")
     return False
@@ -62,8 +317,9 @@ async def read_notebook(
     try:
         logger.debug(f"Reading notebook from: {resolved_path}")
 
-        with open(resolved_path, "r", encoding="utf-8") as f:
-            nb = nbformat.read(f, as_version=4)
+        # Blocking file read + JSON parse run in a worker thread so the
+        # event loop stays responsive for other tool calls.
+        nb = await asyncio.to_thread(_read_notebook_file, resolved_path)
         logger.debug(f"Successfully read notebook: {resolved_path}")
         return nb
     except Exception as e:
@@ -93,15 +349,9 @@ async def write_notebook(
     resolved_path = os.path.realpath(notebook_path)
 
     try:
-        notebook_string = nbformat.writes(nb_node, version=nbformat.NO_CONVERT)
-        if len(notebook_string.encode("utf-8")) > max_notebook_size:
-            raise ValueError(
-                f"Notebook content size ({len(notebook_string.encode('utf-8'))} bytes) exceeds maximum allowed size ({max_notebook_size} bytes)."
-            )
-
         logger.debug(f"Writing notebook to: {resolved_path}")
-        with open(resolved_path, "w", encoding="utf-8") as f:
-            nbformat.write(nb_node, f)
+        # Serialization and the blocking file write run in a worker thread.
+        await asyncio.to_thread(_write_notebook_file, resolved_path, nb_node, max_notebook_size)
         logger.debug(f"Successfully wrote notebook: {resolved_path}")
     except Exception as e:
         logger.error(f"Error writing notebook {resolved_path}: {e}", exc_info=True)
@@ -6,42 +6,83 @@ and launching the appropriate transport.
 """
 
 import sys
-import inspect
-
-from .core.config import ServerConfig
-from .core import branding
-from .tools import (
-    CellToolsProvider,
-    FileToolsProvider,
-    InfoToolsProvider,
-    MetadataToolsProvider,
-    OutputToolsProvider,
-)
+
+from .core.config import ServerConfig, get_version
 from .cli import parse_arguments
-from .core.logging import setup_logging
 
-# --- External Dependencies ---
-try:
-    from fastmcp import FastMCP
-    from loguru import logger
-except ImportError as e:
-    missing_module = str(e).split("'")[1]
-    logger.critical(f"FATAL: Failed to import required library '{missing_module}'. Error: {e}")
-    # Add hint about installing extras if it's an SSE component missing
-    if "uvicorn" in str(e) or "starlette" in str(e):
-        logger.error("Hint: SSE transport requires optional dependencies. Try installing with '[sse]' extra.")
-    sys.exit(1)
+# loguru (and core.logging/core.branding, which are only needed once the
+# server actually starts) is imported after the version fast path in
+# main(), so printing the version never loads the logging stack.
+
 
+# Tool method names discovered per provider class, so repeated server setup
+# (tests, reconnects) scans each class once.
+_tool_names_by_class: dict = {}
 
-def setup_mcp_server(config: ServerConfig) -> FastMCP:
+
+def _iter_tool_methods(provider_instance):
+    """Yields (name, bound method) pairs for a provider's @tool coroutines.
+
+    Walks the provider class dict directly instead of running
+    inspect.getmembers over the instance, which sorted and predicate-tested
+    every attribute (including inherited object machinery) per provider.
+    Methods are selected by their explicit @tool marker (tools.registry),
+    and the discovered names are cached per class.
+    """
+    from .tools.registry import is_tool
+
+    klass = type(provider_instance)
+    names = _tool_names_by_class.get(klass)
+    if names is None:
+        names = []
+        seen = set()
+        for base in klass.__mro__:
+            for name, member in vars(base).items():
+                if name in seen:
+                    continue
+                seen.add(name)
+                if is_tool(member):
+                    names.append(name)
+        _tool_names_by_class[klass] = names
+
+    for name in names:
+        yield name, getattr(provider_instance, name)
+
+
+def setup_mcp_server(config: ServerConfig) -> "FastMCP":  # noqa: F821
     """Initializes the FastMCP server and registers tools from all providers.
 
+    FastMCP and the tool providers are imported here rather than at module
+    top so commands that never start the server (help, version) skip those
+    imports entirely.
+
     Args:
         config: The server configuration object.
 
     Returns:
         The configured FastMCP server instance.
     """
+    from loguru import logger
+
+    # --- External Dependencies ---
+    try:
+        from fastmcp import FastMCP
+    except ImportError as e:
+        missing_module = str(e).split("'")[1]
+        logger.critical(f"FATAL: Failed to import required library '{missing_module}'. Error: {e}")
+        # Add hint about installing extras if it's an SSE component missing
+        if "uvicorn" in str(e) or "starlette" in str(e):
+            logger.error("Hint: SSE transport requires optional dependencies. Try installing with '[sse]' extra.")
+        sys.exit(1)
+
+    from .tools import (
+        CellToolsProvider,
+        FileToolsProvider,
+        InfoToolsProvider,
+        MetadataToolsProvider,
+        OutputToolsProvider,
+    )
+
     logger.debug("Initializing FastMCP server...")
     mcp_server = FastMCP(
         "notebook_mcp",
@@ -64,14 +105,20 @@ def setup_mcp_server(config: ServerConfig) -> FastMCP:
     logger.debug("Registering tools with FastMCP...")
     registered_count = 0
     for provider_instance in providers:
-        for name, method in inspect.getmembers(provider_instance, predicate=inspect.iscoroutinefunction):
-            # Basic check: assume public coroutine methods starting with 'notebook_' or 'diagnose_'
-            # are intended as tools. Could use a decorator later for more robustness.
-            if (name.startswith("notebook_")) and not name.startswith("_"):
+        methods = list(_iter_tool_methods(provider_instance))
+        try:
+            # Happy path: one try-block per provider instead of per method.
+            for name, method in methods:
+                mcp_server.add_tool(method)
+            registered_count += len(methods)
+        except Exception:
+            # Something in this provider failed; retry method-by-method so
+            # one bad tool is logged without masking its siblings.
+            # (Re-adding an already-registered tool just overwrites it.)
+            for name, method in methods:
                 try:
                     mcp_server.add_tool(method)
                     registered_count += 1
-
                 except Exception as e:
                     logger.error(
                         f"Failed to register tool {provider_instance.__class__.__name__}.{name}: {e}",
@@ -81,7 +128,8 @@ def setup_mcp_server(config: ServerConfig) -> FastMCP:
     if registered_count == 0:
         logger.warning("No tools were registered. Check provider methods and registration logic.")
     else:
-        logger.debug(f"Successfully registered {registered_count} tools.")
+        # Placeholder form so the message is only formatted when DEBUG is enabled.
+        logger.debug("Successfully registered {} tools.", registered_count)
 
     return mcp_server
 
@@ -89,22 +137,39 @@ def setup_mcp_server(config: ServerConfig) -> FastMCP:
 def main():
     """Main entry point for the server."""
 
+    # Fast path: a bare version request needs no argparse tree at all.
+    argv = sys.argv[1:]
+    if len(argv) == 1:
+        if argv[0] == "version":
+            print(f"the_notebook_mcp.server {get_version()}")
+            sys.exit(0)
+        if argv[0] in ("-v", "--version"):
+            import os
+
+            print(f"{os.path.basename(sys.argv[0])} {get_version()}")
+            sys.exit(0)
+
+    from loguru import logger
+
+    from .core import branding
+    from .core.logging import setup_logging
+
     logger.remove()
     logger.add(sys.stderr, level="INFO", format="{message}")
 
     args = parse_arguments()
 
     if args.command == "version":
-        print(f"the_notebook_mcp.server {ServerConfig().version}")
+        print(f"the_notebook_mcp.server {get_version()}")
         sys.exit(0)
     elif args.command == "help" and hasattr(args, "help_cmd_show_version") and args.help_cmd_show_version:
-        print(f"the_notebook_mcp.server {ServerConfig().version}")
+        print(f"the_notebook_mcp.server {get_version()}")
         sys.exit(0)
 
     try:
         config = ServerConfig(args=args)
 
-        setup_logging(config.log_dir, config.log_level)
+        setup_logging(config.log_dir, config.log_level, config.file_log_level)
 
     except ValueError as e:
         logger.error(f"Configuration error: {e}")
@@ -113,8 +178,16 @@ def main():
         logger.opt(exception=True).critical(f"Unexpected error during argument parsing or config initialization: {e}")
         sys.exit(1)
 
-    startup_message = branding.get_server_startup_message(config)
-    logger.bind(literal=True).opt(colors=True).info(startup_message)
+    # Render and emit the banner only if an INFO record can reach a sink;
+    # at WARNING+ it would be dropped anyway, so the work is skipped.
+    info_level_no = logger.level("INFO").no
+    min_sink_level_no = min(
+        logger.level(config.log_level.upper()).no,
+        logger.level((config.file_log_level or config.log_level).upper()).no,
+    )
+    if min_sink_level_no <= info_level_no:
+        startup_message = branding.get_server_startup_message(config)
+        logger.bind(literal=True).opt(colors=True).info(startup_message)
 
     try:
         mcp_server = setup_mcp_server(config)
@@ -123,7 +196,7 @@ def main():
             logger.debug("Starting server with STDIO transport.")
             mcp_server.run(**config.get_run_kwargs())
         elif config.transport == "streamable-http" or config.transport == "sse":
-            logger.debug(f"Starting server with {config.transport.upper()} transport.")
+            logger.debug("Starting server with {} transport.", config.transport.upper())
             mcp_server.run(**config.get_run_kwargs())
         else:
             logger.critical(f"Invalid transport specified: {config.transport}. Exiting.")
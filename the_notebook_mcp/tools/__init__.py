@@ -1,15 +1,32 @@
-"""Initializes the tools package and imports tool provider classes."""
-
-from .cell_tools import CellToolsProvider
-from .file_tools import FileToolsProvider
-from .info_tools import InfoToolsProvider
-from .metadata_tools import MetadataToolsProvider
-from .output_tools import OutputToolsProvider
-
-__all__ = [
-    "CellToolsProvider",
-    "FileToolsProvider",
-    "InfoToolsProvider",
-    "MetadataToolsProvider",
-    "OutputToolsProvider",
-]
+"""Initializes the tools package and lazily re-exports tool provider classes.
+
+The provider modules are imported on first attribute access (PEP 562)
+rather than at package import, so consumers that need only one provider
+(or just the registry) do not pay for parsing all five modules.
+"""
+
+import importlib
+
+_LAZY = {
+    "CellToolsProvider": ".cell_tools",
+    "FileToolsProvider": ".file_tools",
+    "InfoToolsProvider": ".info_tools",
+    "MetadataToolsProvider": ".metadata_tools",
+    "OutputToolsProvider": ".output_tools",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Cache on the package so subsequent accesses skip __getattr__.
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
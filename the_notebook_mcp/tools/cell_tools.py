@@ -2,7 +2,7 @@
 Tools for cell manipulation (add, edit, delete, move, split, merge, type change, duplicate).
 """
 
-import copy
+import uuid
 from typing import List, Dict, Tuple
 from loguru import logger
 import os
@@ -10,7 +10,9 @@ import os
 import nbformat
 
 from ..core.config import ServerConfig
+from .registry import tool
 from ..core import notebook_ops
+from . import tool_utils
 
 from jupyter_kernel_client import KernelClient
 from jupyter_nbmodel_client import (
@@ -18,8 +20,79 @@ from jupyter_nbmodel_client import (
     get_jupyter_notebook_websocket_url,
 )
 
+# The expected ("not a bug") error types shared by every cell tool's except
+# clause. One module-level tuple instead of eight inline ones keeps the
+# handlers in sync and the method bodies smaller.
+_EXPECTED_TOOL_ERRORS = (
+    ValueError,
+    FileNotFoundError,
+    IndexError,
+    IOError,
+    PermissionError,
+    nbformat.validator.ValidationError,
+)
+
+# Cell constructors by type: one hash lookup covers both the validity check
+# and the dispatch where the construction signature is uniform.
+_CELL_CTORS = {
+    "code": nbformat.v4.new_code_cell,
+    "markdown": nbformat.v4.new_markdown_cell,
+    "raw": nbformat.v4.new_raw_cell,
+}
+_ALLOWED_CELL_TYPES = frozenset(_CELL_CTORS)
+
+# Logger pre-bound with tool_success=True: binding per success call rebuilds
+# the extras dict on every tool invocation, and these fire once per edit in
+# IDE-driven usage. depth=1 keeps the reported origin at the tool method.
+_success_log = logger.bind(tool_success=True).opt(depth=1)
+
+
+def _log_success(tool: str, message: str, *args) -> None:
+    """Emits a tool success record; positional args defer formatting to loguru."""
+    _success_log.info("[Tool: " + tool + "] SUCCESS - " + message, *args)
+
+
+def _process_output(output, max_size: int, cell_index: int) -> dict:
+    """Converts one raw execution output to a plain dict, truncating oversized payloads.
+
+    Mirrors the truncation rules of notebook_read_cell_output: string data
+    and text fields over max_size are replaced with a placeholder carrying
+    the byte count and a 256-char preview. Payloads are only UTF-8 encoded
+    when they actually get truncated.
+    """
+    output_dict = dict(output)
+
+    if "data" in output_dict and isinstance(output_dict["data"], dict):
+        for mime_type, data_content in output_dict["data"].items():
+            if isinstance(data_content, str):
+                if tool_utils.utf8_size_exceeds(data_content, max_size):
+                    byte_size = len(data_content.encode("utf-8"))
+                    if mime_type.startswith("image/"):
+                        output_dict["data"][mime_type] = f"<image data too large: {byte_size} bytes>"
+                    else:
+                        output_dict["data"][mime_type] = (
+                            f"<data too large: {byte_size} bytes, first 256 chars: {data_content[:256]}...>"
+                        )
+                    logger.warning(
+                        f"[Tool: notebook_execute_cell] Truncated large data for mime_type '{mime_type}' in cell {cell_index}."
+                    )
+
+    elif "text" in output_dict and isinstance(output_dict["text"], (str, list)):
+        text_content = output_dict["text"]
+        if isinstance(text_content, list):
+            text_content = "".join(text_content)
+
+        if tool_utils.utf8_size_exceeds(text_content, max_size):
+            byte_size = len(text_content.encode("utf-8"))
+            output_dict["text"] = f"<text data too large: {byte_size} bytes, first 256 chars: {text_content[:256]}...>"
+            logger.warning(f"[Tool: notebook_execute_cell] Truncated large text output in cell {cell_index}.")
+
+    return output_dict
+
 
 class CellToolsProvider:
+    __slots__ = ("config", "_kernel_cache")
+
     def __init__(self, config: ServerConfig):
         self.config = config
         logger.debug("CellToolsProvider initialized.")
@@ -28,6 +101,7 @@ class CellToolsProvider:
         # Values are KernelClient instances
         self._kernel_cache: Dict[Tuple[str, str, str], KernelClient] = {}
 
+    @tool
     async def notebook_edit_cell(self, notebook_path: str, cell_index: int, source: str) -> str:
         """Replaces the source content of a specific cell in a Jupyter Notebook.
 
@@ -37,40 +111,34 @@ class CellToolsProvider:
             source: The new source code or markdown content for the cell.
         """
         logger.debug(
-            f"[Tool: notebook_edit_cell] Called. Args: path={notebook_path}, index={cell_index}, source_len={len(source)}"
+            "[Tool: notebook_edit_cell] Called. Args: path={}, index={}, source_len={}",
+            notebook_path,
+            cell_index,
+            len(source),
         )
         try:
             # Validate source size
-            if len(source.encode("utf-8")) > self.config.max_cell_source_size:
+            if tool_utils.utf8_size_exceeds(source, self.config.max_cell_source_size):
                 raise ValueError(
                     f"Source content exceeds maximum allowed size ({self.config.max_cell_source_size} bytes)."
                 )
 
-            nb = await notebook_ops.read_notebook(notebook_path, self.config.allow_root_dirs)
-            if not 0 <= cell_index < len(nb.cells):
-                raise IndexError(f"Cell index {cell_index} is out of bounds (0-{len(nb.cells) - 1}).")
-
-            nb.cells[cell_index].source = source
-            await notebook_ops.write_notebook(notebook_path, nb, self.config.allow_root_dirs)
-            logger.info(
-                f"[Tool: notebook_edit_cell] SUCCESS - Edited cell {cell_index}.",
-                tool_success=True,
-            )
+            async with notebook_ops.mutate(notebook_path, self.config.allow_root_dirs) as nb:
+                num_cells = len(nb.cells)
+                if not 0 <= cell_index < num_cells:
+                    raise IndexError(f"Cell index {cell_index} is out of bounds (0-{num_cells - 1}).")
+
+                nb.cells[cell_index].source = source
+            _log_success("notebook_edit_cell", "Edited cell {}.", cell_index)
             return f"Successfully edited cell {cell_index} in {notebook_path}"
-        except (
-            ValueError,
-            FileNotFoundError,
-            IndexError,
-            IOError,
-            PermissionError,
-            nbformat.validator.ValidationError,
-        ) as e:
+        except _EXPECTED_TOOL_ERRORS as e:
             logger.error(f"[Tool: notebook_edit_cell] FAILED - Specific error: {e}")
             raise
         except Exception as e:
             logger.exception(f"[Tool: notebook_edit_cell] FAILED - Unexpected error: {e}")
             raise RuntimeError(f"An unexpected error occurred: {e}") from e
 
+    @tool
     async def notebook_add_cell(self, notebook_path: str, cell_type: str, source: str, insert_after_index: int) -> str:
         """Adds a new cell to a Jupyter Notebook after the specified index.
 
@@ -81,51 +149,45 @@ class CellToolsProvider:
             insert_after_index: The 0-based index after which to insert the new cell (-1 to insert at the beginning).
         """
         logger.debug(
-            f"[Tool: notebook_add_cell] Called. Args: path={notebook_path}, type={cell_type}, after_index={insert_after_index}, source_len={len(source)}"
+            "[Tool: notebook_add_cell] Called. Args: path={}, type={}, after_index={}, source_len={}",
+            notebook_path,
+            cell_type,
+            insert_after_index,
+            len(source),
         )
         try:
             # Validate source size
-            if len(source.encode("utf-8")) > self.config.max_cell_source_size:
+            if tool_utils.utf8_size_exceeds(source, self.config.max_cell_source_size):
                 raise ValueError(
                     f"Source content exceeds maximum allowed size ({self.config.max_cell_source_size} bytes)."
                 )
 
-            nb = await notebook_ops.read_notebook(notebook_path, self.config.allow_root_dirs)
-
-            if cell_type == "code":
-                new_cell = nbformat.v4.new_code_cell(source)
-            elif cell_type == "markdown":
-                new_cell = nbformat.v4.new_markdown_cell(source)
-            else:
-                raise ValueError("Invalid cell_type: Must be 'code' or 'markdown'.")
-
-            insertion_index = insert_after_index + 1
-            if not 0 <= insertion_index <= len(nb.cells):
-                raise IndexError(
-                    f"Insertion index {insertion_index} (based on insert_after_index {insert_after_index}) is out of bounds (0-{len(nb.cells)})."
-                )
+            async with notebook_ops.mutate(notebook_path, self.config.allow_root_dirs) as nb:
+                if cell_type == "code":
+                    new_cell = nbformat.v4.new_code_cell(source)
+                elif cell_type == "markdown":
+                    new_cell = nbformat.v4.new_markdown_cell(source)
+                else:
+                    raise ValueError("Invalid cell_type: Must be 'code' or 'markdown'.")
+
+                insertion_index = insert_after_index + 1
+                num_cells = len(nb.cells)
+                if not 0 <= insertion_index <= num_cells:
+                    raise IndexError(
+                        f"Insertion index {insertion_index} (based on insert_after_index {insert_after_index}) is out of bounds (0-{num_cells})."
+                    )
 
-            nb.cells.insert(insertion_index, new_cell)
-            await notebook_ops.write_notebook(notebook_path, nb, self.config.allow_root_dirs)
-            logger.info(
-                f"[Tool: notebook_add_cell] SUCCESS - Added {cell_type} cell at index {insertion_index}.",
-                tool_success=True,
-            )
+                nb.cells.insert(insertion_index, new_cell)
+            _log_success("notebook_add_cell", "Added {} cell at index {}.", cell_type, insertion_index)
             return f"Successfully added {cell_type} cell at index {insertion_index} in {notebook_path}"
-        except (
-            ValueError,
-            FileNotFoundError,
-            IndexError,
-            IOError,
-            PermissionError,
-            nbformat.validator.ValidationError,
-        ) as e:
+        except _EXPECTED_TOOL_ERRORS as e:
             logger.error(f"[Tool: notebook_add_cell] FAILED - Specific error: {e}")
             raise
         except Exception as e:
             logger.exception(f"[Tool: notebook_add_cell] FAILED - Unexpected error: {e}")
             raise RuntimeError(f"An unexpected error occurred: {e}") from e
 
+    @tool
     async def notebook_delete_cell(self, notebook_path: str, cell_index: int) -> str:
         """Deletes a specific cell from a Jupyter Notebook.
 
@@ -133,33 +195,24 @@ class CellToolsProvider:
             notebook_path: Absolute path to the .ipynb file.
             cell_index: The 0-based index of the cell to delete.
         """
-        logger.debug(f"[Tool: notebook_delete_cell] Called. Args: path={notebook_path}, index={cell_index}")
+        logger.debug("[Tool: notebook_delete_cell] Called. Args: path={}, index={}", notebook_path, cell_index)
         try:
-            nb = await notebook_ops.read_notebook(notebook_path, self.config.allow_root_dirs)
-            if not 0 <= cell_index < len(nb.cells):
-                raise IndexError(f"Cell index {cell_index} is out of bounds (0-{len(nb.cells) - 1}).")
-
-            del nb.cells[cell_index]
-            await notebook_ops.write_notebook(notebook_path, nb, self.config.allow_root_dirs)
-            logger.info(
-                f"[Tool: notebook_delete_cell] SUCCESS - Deleted cell {cell_index}.",
-                tool_success=True,
-            )
+            async with notebook_ops.mutate(notebook_path, self.config.allow_root_dirs) as nb:
+                num_cells = len(nb.cells)
+                if not 0 <= cell_index < num_cells:
+                    raise IndexError(f"Cell index {cell_index} is out of bounds (0-{num_cells - 1}).")
+
+                del nb.cells[cell_index]
+            _log_success("notebook_delete_cell", "Deleted cell {}.", cell_index)
             return f"Successfully deleted cell {cell_index} from {notebook_path}"
-        except (
-            ValueError,
-            FileNotFoundError,
-            IndexError,
-            IOError,
-            PermissionError,
-            nbformat.validator.ValidationError,
-        ) as e:
+        except _EXPECTED_TOOL_ERRORS as e:
             logger.error(f"[Tool: notebook_delete_cell] FAILED - Specific error: {e}")
             raise
         except Exception as e:
             logger.exception(f"[Tool: notebook_delete_cell] FAILED - Unexpected error: {e}")
             raise RuntimeError(f"An unexpected error occurred: {e}") from e
 
+    @tool
     async def notebook_move_cell(self, notebook_path: str, from_index: int, to_index: int) -> str:
         """Moves a cell from one position to another.
 
@@ -172,51 +225,54 @@ class CellToolsProvider:
         Returns:
             A success message string.
         """
-        logger.debug(f"[Tool: notebook_move_cell] Called. Args: path={notebook_path}, from={from_index}, to={to_index}")
+        logger.debug(
+            "[Tool: notebook_move_cell] Called. Args: path={}, from={}, to={}", notebook_path, from_index, to_index
+        )
         try:
-            nb = await notebook_ops.read_notebook(notebook_path, self.config.allow_root_dirs)
-            num_cells = len(nb.cells)
-
-            if not 0 <= from_index < num_cells:
-                raise IndexError(f"Source index {from_index} is out of bounds (0-{num_cells - 1}).")
-            # Allow moving to the very end (index == num_cells)
-            if not 0 <= to_index <= num_cells:
-                raise IndexError(f"Destination index {to_index} is out of bounds (0-{num_cells}).")
-
-            # No change if indices are the same
-            if from_index == to_index:
-                logger.debug("[Tool: notebook_move_cell] SKIPPED - Cell move results in no change.")
-                return f"Cell at index {from_index} was not moved (source and destination are the same)."
-
-            # Remove the cell from its current position
-            cell_to_move = nb.cells.pop(from_index)
-
-            # Insert at the target index
-            # If we're moving to the end of the notebook, we need to handle that case
-            # If from_index < to_index, we need to account for the removal of the cell
-            insert_at = to_index if from_index >= to_index else to_index - 1
-            nb.cells.insert(insert_at, cell_to_move)
-
-            await notebook_ops.write_notebook(notebook_path, nb, self.config.allow_root_dirs)
-            logger.info(
-                f"[Tool: notebook_move_cell] SUCCESS - Moved cell from {from_index} to {to_index}.",
-                tool_success=True,
-            )
+            async with notebook_ops.edit_lock(notebook_path):
+                nb = await notebook_ops.read_notebook(notebook_path, self.config.allow_root_dirs)
+                num_cells = len(nb.cells)
+
+                if not 0 <= from_index < num_cells:
+                    raise IndexError(f"Source index {from_index} is out of bounds (0-{num_cells - 1}).")
+                # Allow moving to the very end (index == num_cells)
+                if not 0 <= to_index <= num_cells:
+                    raise IndexError(f"Destination index {to_index} is out of bounds (0-{num_cells}).")
+
+                # No change if indices are the same
+                if from_index == to_index:
+                    logger.debug("[Tool: notebook_move_cell] SKIPPED - Cell move results in no change.")
+                    return f"Cell at index {from_index} was not moved (source and destination are the same)."
+
+                if from_index - to_index == 1:
+                    # Adjacent move up is a plain swap — no list shifting.
+                    nb.cells[to_index], nb.cells[from_index] = nb.cells[from_index], nb.cells[to_index]
+                else:
+                    # Rotate the affected window with one slice assignment
+                    # instead of pop + insert, which each memmove the whole
+                    # list tail. Same semantics as before: to_index counts
+                    # positions in the pre-move list, so a downward move
+                    # lands the cell at to_index - 1.
+                    cells = nb.cells
+                    cell_to_move = cells[from_index]
+                    if from_index < to_index:
+                        cells[from_index : to_index - 1] = cells[from_index + 1 : to_index]
+                        cells[to_index - 1] = cell_to_move
+                    else:
+                        cells[to_index + 1 : from_index + 1] = cells[to_index:from_index]
+                        cells[to_index] = cell_to_move
+
+                await notebook_ops.write_notebook(notebook_path, nb, self.config.allow_root_dirs)
+            _log_success("notebook_move_cell", "Moved cell from {} to {}.", from_index, to_index)
             return f"Successfully moved cell from index {from_index} to {to_index} in {notebook_path}"
-        except (
-            ValueError,
-            FileNotFoundError,
-            IndexError,
-            IOError,
-            PermissionError,
-            nbformat.validator.ValidationError,
-        ) as e:
+        except _EXPECTED_TOOL_ERRORS as e:
             logger.error(f"[Tool: notebook_move_cell] FAILED - Specific error: {e}")
             raise
         except Exception as e:
             logger.exception(f"[Tool: notebook_move_cell] FAILED - Unexpected error: {e}")
             raise RuntimeError(f"An unexpected error occurred: {e}") from e
 
+    @tool
     async def notebook_split_cell(self, notebook_path: str, cell_index: int, split_at_line: int) -> str:
         """Splits a cell into two at a specified line number.
 
@@ -231,85 +287,84 @@ class CellToolsProvider:
             A success message string.
         """
         logger.debug(
-            f"[Tool: notebook_split_cell] Called. Args: path={notebook_path}, index={cell_index}, line={split_at_line}"
+            "[Tool: notebook_split_cell] Called. Args: path={}, index={}, line={}",
+            notebook_path,
+            cell_index,
+            split_at_line,
         )
         try:
             # Load the notebook using notebook_ops
-            nb = await notebook_ops.read_notebook(notebook_path, self.config.allow_root_dirs)
-            if not 0 <= cell_index < len(nb.cells):
-                raise IndexError(f"Cell index {cell_index} is out of bounds (0-{len(nb.cells) - 1}).")
+            async with notebook_ops.mutate(notebook_path, self.config.allow_root_dirs) as nb:
+                num_cells = len(nb.cells)
+                if not 0 <= cell_index < num_cells:
+                    raise IndexError(f"Cell index {cell_index} is out of bounds (0-{num_cells - 1}).")
+
+                # Get the cell to split and its content
+                cell_to_split = nb.cells[cell_index]
+                source = cell_to_split.get("source", "")
+
+                # Convert 1-based line number (user-friendly) to 0-based index (for Python slicing)
+                split_index = split_at_line - 1
+
+                # Walk to the split point's newline with str.find rather than
+                # materializing every line via splitlines + join: one pass over
+                # the source and two slices, no intermediate line list.
+                pos = -1
+                if split_index > 0:
+                    for _ in range(split_index):
+                        pos = source.find("\n", pos + 1)
+                        if pos == -1:
+                            break
+
+                # Invalid if splitting before line 2, past the last newline,
+                # or at a position that would leave the second part empty.
+                if split_index <= 0 or pos == -1 or pos + 1 >= len(source):
+                    # Only the error message needs the actual line count.
+                    line_count = source.count("\n") + (1 if source and not source.endswith("\n") else 0)
+                    raise ValueError(
+                        f"Split line number {split_at_line} is out of bounds for cell with {line_count} lines."
+                    )
 
-            # Get the cell to split and its content
-            cell_to_split = nb.cells[cell_index]
-            source = cell_to_split.get("source", "")
+                source_part1 = source[: pos + 1]  # First part: lines before split point
+                source_part2 = source[pos + 1 :]  # Second part: split point line and all lines after
 
-            # Split source into lines while preserving line endings
-            lines = source.splitlines(True)
+                # Validate the size of both parts to ensure they don't exceed allowed limits
+                max_size = self.config.max_cell_source_size
+                if tool_utils.utf8_size_exceeds(source_part1, max_size) or tool_utils.utf8_size_exceeds(
+                    source_part2, max_size
+                ):
+                    raise ValueError(
+                        f"Resulting source content after split exceeds maximum allowed size ({max_size} bytes) for one or both cells."
+                    )
 
-            # Convert 1-based line number (user-friendly) to 0-based index (for Python slicing)
-            split_index = split_at_line - 1
+                # Update the original cell with just the first part
+                cell_to_split.source = source_part1
 
-            # Validate split position is within bounds
-            if not 0 < split_index < len(lines):
-                raise ValueError(
-                    f"Split line number {split_at_line} is out of bounds for cell with {len(lines)} lines."
-                )
+                # If it's a code cell, clear outputs and execution count since content changed
+                if cell_to_split.cell_type == "code":
+                    cell_to_split.outputs = []
+                    cell_to_split.execution_count = None
 
-            # Create two separate content parts by slicing the lines list
-            source_part1 = "".join(lines[:split_index])  # First part: lines before split point
-            source_part2 = "".join(lines[split_index:])  # Second part: split point line and all lines after
+                # Create a new cell for the second part with the same metadata and type as original
+                new_cell_metadata = notebook_ops.clone_node(cell_to_split.metadata)
 
-            # Validate the size of both parts to ensure they don't exceed allowed limits
-            max_size = self.config.max_cell_source_size
-            if len(source_part1.encode("utf-8")) > max_size or len(source_part2.encode("utf-8")) > max_size:
-                raise ValueError(
-                    f"Resulting source content after split exceeds maximum allowed size ({max_size} bytes) for one or both cells."
-                )
+                # Create the appropriate type of new cell based on the original cell's type
+                ctor = _CELL_CTORS.get(cell_to_split.cell_type, nbformat.v4.new_raw_cell)
+                new_cell = ctor(source=source_part2, metadata=new_cell_metadata)
 
-            # Update the original cell with just the first part
-            cell_to_split.source = source_part1
-
-            # If it's a code cell, clear outputs and execution count since content changed
-            if cell_to_split.cell_type == "code":
-                cell_to_split.outputs = []
-                cell_to_split.execution_count = None
-
-            # Create a new cell for the second part with the same metadata and type as original
-            new_cell_metadata = copy.deepcopy(cell_to_split.metadata)
-
-            # Create the appropriate type of new cell based on the original cell's type
-            if cell_to_split.cell_type == "code":
-                new_cell = nbformat.v4.new_code_cell(source=source_part2, metadata=new_cell_metadata)
-            elif cell_to_split.cell_type == "markdown":
-                new_cell = nbformat.v4.new_markdown_cell(source=source_part2, metadata=new_cell_metadata)
-            else:  # Raw cell
-                new_cell = nbformat.v4.new_raw_cell(source=source_part2, metadata=new_cell_metadata)
-
-            # Insert the new cell immediately after the original cell
-            nb.cells.insert(cell_index + 1, new_cell)
-
-            # Save the modified notebook back to disk
-            await notebook_ops.write_notebook(notebook_path, nb, self.config.allow_root_dirs)
-            logger.info(
-                f"[Tool: notebook_split_cell] SUCCESS - Split cell {cell_index} at line {split_at_line}.",
-                tool_success=True,
-            )
+                # Insert the new cell immediately after the original cell
+                nb.cells.insert(cell_index + 1, new_cell)
+            _log_success("notebook_split_cell", "Split cell {} at line {}.", cell_index, split_at_line)
             return f"Successfully split cell {cell_index} at line {split_at_line}."
 
-        except (
-            PermissionError,
-            FileNotFoundError,
-            IndexError,
-            ValueError,
-            nbformat.validator.ValidationError,
-            IOError,
-        ) as e:
+        except _EXPECTED_TOOL_ERRORS as e:
             logger.error(f"[Tool: notebook_split_cell] FAILED - {e}")
             raise
         except Exception as e:
             logger.exception(f"[Tool: notebook_split_cell] FAILED - Unexpected error: {e}")
             raise RuntimeError(f"An unexpected error occurred while splitting cell {cell_index}: {e}") from e
 
+    @tool
     async def notebook_merge_cells(self, notebook_path: str, first_cell_index: int) -> str:
         """Merges a cell with the one immediately following it.
 
@@ -327,59 +382,55 @@ class CellToolsProvider:
         Returns:
             A success message string.
         """
-        logger.debug(f"[Tool: notebook_merge_cells] Called. Args: path={notebook_path}, index={first_cell_index}")
+        logger.debug("[Tool: notebook_merge_cells] Called. Args: path={}, index={}", notebook_path, first_cell_index)
         try:
-            nb = await notebook_ops.read_notebook(notebook_path, self.config.allow_root_dirs)
-            if not 0 <= first_cell_index < len(nb.cells) - 1:
-                raise IndexError(f"Invalid index {first_cell_index}: Cannot merge last cell or index out of bounds.")
-
-            cell1 = nb.cells[first_cell_index]
-            cell2 = nb.cells[first_cell_index + 1]
+            async with notebook_ops.mutate(notebook_path, self.config.allow_root_dirs) as nb:
+                num_cells = len(nb.cells)
+                if not 0 <= first_cell_index < num_cells - 1:
+                    raise IndexError(
+                        f"Invalid index {first_cell_index}: Cannot merge last cell or index out of bounds."
+                    )
 
-            if cell1.cell_type != cell2.cell_type:
-                raise ValueError(f"Cannot merge cells of different types ({cell1.cell_type} and {cell2.cell_type}).")
-            if cell1.cell_type not in ("code", "markdown"):
-                raise ValueError(f"Merging is only supported for code and markdown cells (found {cell1.cell_type}).")
+                cell1 = nb.cells[first_cell_index]
+                cell2 = nb.cells[first_cell_index + 1]
 
-            source1 = cell1.get("source", "")
-            source2 = cell2.get("source", "")
+                if cell1.cell_type != cell2.cell_type:
+                    raise ValueError(
+                        f"Cannot merge cells of different types ({cell1.cell_type} and {cell2.cell_type})."
+                    )
+                if cell1.cell_type not in ("code", "markdown"):
+                    raise ValueError(
+                        f"Merging is only supported for code and markdown cells (found {cell1.cell_type})."
+                    )
 
-            separator = "\n"
-            merged_source = source1 + separator + source2
+                source1 = cell1.get("source", "")
+                source2 = cell2.get("source", "")
 
-            if len(merged_source.encode("utf-8")) > self.config.max_cell_source_size:
-                raise ValueError(
-                    f"Merged source content exceeds maximum allowed size ({self.config.max_cell_source_size} bytes)."
-                )
+                separator = "\n"
+                merged_source = source1 + separator + source2
 
-            cell1.source = merged_source
-            if cell1.cell_type == "code":
-                cell1.outputs = []
-                cell1.execution_count = None
+                if tool_utils.utf8_size_exceeds(merged_source, self.config.max_cell_source_size):
+                    raise ValueError(
+                        f"Merged source content exceeds maximum allowed size ({self.config.max_cell_source_size} bytes)."
+                    )
 
-            del nb.cells[first_cell_index + 1]
+                cell1.source = merged_source
+                if cell1.cell_type == "code":
+                    cell1.outputs = []
+                    cell1.execution_count = None
 
-            await notebook_ops.write_notebook(notebook_path, nb, self.config.allow_root_dirs)
-            logger.info(
-                f"[Tool: notebook_merge_cells] SUCCESS - Merged cell {first_cell_index + 1} into cell {first_cell_index}.",
-                tool_success=True,
-            )
+                del nb.cells[first_cell_index + 1]
+            _log_success("notebook_merge_cells", "Merged cell {} into cell {}.", first_cell_index + 1, first_cell_index)
             return f"Successfully merged cell {first_cell_index + 1} into cell {first_cell_index}."
 
-        except (
-            PermissionError,
-            FileNotFoundError,
-            IndexError,
-            ValueError,
-            nbformat.validator.ValidationError,
-            IOError,
-        ) as e:
+        except _EXPECTED_TOOL_ERRORS as e:
             logger.error(f"[Tool: notebook_merge_cells] FAILED - {e}")
             raise
         except Exception as e:
             logger.exception(f"[Tool: notebook_merge_cells] FAILED - Unexpected error: {e}")
             raise RuntimeError(f"An unexpected error occurred while merging cells: {e}") from e
 
+    @tool
     async def notebook_change_cell_type(self, notebook_path: str, cell_index: int, new_type: str) -> str:
         """Changes the type of a specific cell (e.g., code to markdown).
 
@@ -394,67 +445,67 @@ class CellToolsProvider:
             A success message string.
         """
         logger.debug(
-            f"[Tool: notebook_change_cell_type] Called. Args: path={notebook_path}, index={cell_index}, type={new_type}"
+            "[Tool: notebook_change_cell_type] Called. Args: path={}, index={}, type={}",
+            notebook_path,
+            cell_index,
+            new_type,
         )
 
-        allowed_types = ("code", "markdown", "raw")
-        if new_type not in allowed_types:
-            raise ValueError(f"Invalid target cell type '{new_type}'. Must be one of {allowed_types}.")
+        if new_type not in _ALLOWED_CELL_TYPES:
+            raise ValueError(
+                f"Invalid target cell type '{new_type}'. Must be one of {tuple(sorted(_ALLOWED_CELL_TYPES))}."
+            )
 
         try:
-            nb = await notebook_ops.read_notebook(notebook_path, self.config.allow_root_dirs)
-            if not 0 <= cell_index < len(nb.cells):
-                raise IndexError(f"Cell index {cell_index} is out of bounds (0-{len(nb.cells) - 1}).")
-
-            original_cell = nb.cells[cell_index]
-            original_type = original_cell.cell_type
-
-            if original_type == new_type:
-                logger.debug(
-                    f"[Tool: notebook_change_cell_type] Cell is already of type '{new_type}'. No change needed."
-                )
-                return f"Cell {cell_index} is already of type '{new_type}'."
-
-            source = original_cell.get("source", "")
-            metadata = copy.deepcopy(original_cell.metadata)
-            attachments = copy.deepcopy(original_cell.get("attachments", {}))
-
-            if new_type == "code":
-                new_cell = nbformat.v4.new_code_cell(source=source, metadata=metadata)
-                if attachments:
-                    logger.warning(
-                        f"[Tool: notebook_change_cell_type] Discarding attachments when converting cell {cell_index} to code type."
+            async with notebook_ops.edit_lock(notebook_path):
+                nb = await notebook_ops.read_notebook(notebook_path, self.config.allow_root_dirs)
+                num_cells = len(nb.cells)
+                if not 0 <= cell_index < num_cells:
+                    raise IndexError(f"Cell index {cell_index} is out of bounds (0-{num_cells - 1}).")
+
+                original_cell = nb.cells[cell_index]
+                original_type = original_cell.cell_type
+
+                if original_type == new_type:
+                    logger.debug(
+                        "[Tool: notebook_change_cell_type] Cell is already of type '{}'. No change needed.",
+                        new_type,
                     )
-            elif new_type == "markdown":
-                new_cell = nbformat.v4.new_markdown_cell(source=source, metadata=metadata, attachments=attachments)
-            else:  # new_type == 'raw'
-                new_cell = nbformat.v4.new_raw_cell(source=source, metadata=metadata)
-                if attachments:
-                    new_cell["attachments"] = attachments
-
-            nb.cells[cell_index] = new_cell
-
-            await notebook_ops.write_notebook(notebook_path, nb, self.config.allow_root_dirs)
-            logger.info(
-                f"[Tool: notebook_change_cell_type] SUCCESS - Changed cell {cell_index} from '{original_type}' to '{new_type}'.",
-                tool_success=True,
+                    return f"Cell {cell_index} is already of type '{new_type}'."
+
+                source = original_cell.get("source", "")
+                metadata = notebook_ops.clone_node(original_cell.metadata)
+                attachments = notebook_ops.clone_node(original_cell.get("attachments", {}))
+
+                if new_type == "code":
+                    new_cell = nbformat.v4.new_code_cell(source=source, metadata=metadata)
+                    if attachments:
+                        logger.warning(
+                            f"[Tool: notebook_change_cell_type] Discarding attachments when converting cell {cell_index} to code type."
+                        )
+                elif new_type == "markdown":
+                    new_cell = nbformat.v4.new_markdown_cell(source=source, metadata=metadata, attachments=attachments)
+                else:  # new_type == 'raw'
+                    new_cell = nbformat.v4.new_raw_cell(source=source, metadata=metadata)
+                    if attachments:
+                        new_cell["attachments"] = attachments
+
+                nb.cells[cell_index] = new_cell
+
+                await notebook_ops.write_notebook(notebook_path, nb, self.config.allow_root_dirs)
+            _log_success(
+                "notebook_change_cell_type", "Changed cell {} from '{}' to '{}'.", cell_index, original_type, new_type
             )
             return f"Successfully changed cell {cell_index} to type '{new_type}'."
 
-        except (
-            PermissionError,
-            FileNotFoundError,
-            IndexError,
-            ValueError,
-            nbformat.validator.ValidationError,
-            IOError,
-        ) as e:
+        except _EXPECTED_TOOL_ERRORS as e:
             logger.error(f"[Tool: notebook_change_cell_type] FAILED - {e}")
             raise
         except Exception as e:
             logger.exception(f"[Tool: notebook_change_cell_type] FAILED - Unexpected error: {e}")
             raise RuntimeError(f"An unexpected error occurred while changing cell type: {e}") from e
 
+    @tool
     async def notebook_duplicate_cell(self, notebook_path: str, cell_index: int, count: int = 1) -> str:
         """Duplicates a cell one or more times, inserting the copies after the original cell.
 
@@ -467,66 +518,61 @@ class CellToolsProvider:
             A success message with the number of duplicated cells.
         """
         logger.debug(
-            f"[Tool: notebook_duplicate_cell] Called. Args: path={notebook_path}, index={cell_index}, count={count}"
+            "[Tool: notebook_duplicate_cell] Called. Args: path={}, index={}, count={}",
+            notebook_path,
+            cell_index,
+            count,
         )
         try:
-            # Read existing notebook
-            nb = await notebook_ops.read_notebook(notebook_path, self.config.allow_root_dirs)
-
-            # Validate cell index
-            if not 0 <= cell_index < len(nb.cells):
-                raise IndexError(f"Cell index {cell_index} is out of bounds (0-{len(nb.cells) - 1}).")
-
-            # Validate count
-            if count < 1:
-                raise ValueError("Count must be at least 1.")
-
-            # Get the cell to duplicate
-            source_cell = nb.cells[cell_index]
-
-            # Create copies and insert right after the source cell
-            import uuid
-            import copy
-
-            for i in range(count):
-                # Deep copy to avoid shared references
-                new_cell = copy.deepcopy(source_cell)
-
-                # Add a fresh cell ID to avoid duplicates
-                new_cell["id"] = str(uuid.uuid4())
-
-                # If it's a code cell, clear execution outputs and count
-                if new_cell.cell_type == "code":
-                    new_cell["outputs"] = []
-                    new_cell["execution_count"] = None
-
-                # Insert the new cell after the original (and any previously inserted copies)
-                insert_pos = cell_index + 1 + i
-                nb.cells.insert(insert_pos, new_cell)
-
-            # Write the modified notebook back
-            await notebook_ops.write_notebook(notebook_path, nb, self.config.allow_root_dirs)
-
-            logger.info(
-                f"[Tool: notebook_duplicate_cell] SUCCESS - Duplicated cell {cell_index} {count} times in {notebook_path}.",
-                tool_success=True,
+            async with notebook_ops.mutate(notebook_path, self.config.allow_root_dirs) as nb:
+                # Validate cell index
+                num_cells = len(nb.cells)
+                if not 0 <= cell_index < num_cells:
+                    raise IndexError(f"Cell index {cell_index} is out of bounds (0-{num_cells - 1}).")
+
+                # Validate count
+                if count < 1:
+                    raise ValueError("Count must be at least 1.")
+
+                # Get the cell to duplicate
+                source_cell = nb.cells[cell_index]
+
+                # Clone the source cell once and prune it (duplicates never
+                # keep outputs or execution counts), so the remaining count-1
+                # clones copy only the pruned cell instead of re-traversing
+                # potentially large outputs for every copy.
+                template = notebook_ops.clone_node(source_cell)
+                if template.cell_type == "code":
+                    template["outputs"] = []
+                    template["execution_count"] = None
+                template["id"] = str(uuid.uuid4())
+
+                # Build all copies first, then splice them in with one slice
+                # assignment: repeated insert() shifts the tail of the cell list
+                # for every copy, while the slice assignment shifts it once.
+                new_cells = [template]
+                for _ in range(count - 1):
+                    new_cell = notebook_ops.clone_node(template)
+                    # Each copy still needs its own fresh cell ID
+                    new_cell["id"] = str(uuid.uuid4())
+                    new_cells.append(new_cell)
+
+                # Insert the new cells right after the original
+                nb.cells[cell_index + 1 : cell_index + 1] = new_cells
+
+            _log_success(
+                "notebook_duplicate_cell", "Duplicated cell {} {} times in {}.", cell_index, count, notebook_path
             )
             return f"Successfully duplicated cell {cell_index} {count} times."
 
-        except (
-            PermissionError,
-            FileNotFoundError,
-            IndexError,
-            ValueError,
-            nbformat.validator.ValidationError,
-            IOError,
-        ) as e:
+        except _EXPECTED_TOOL_ERRORS as e:
             logger.error(f"[Tool: notebook_duplicate_cell] FAILED - {e}")
             raise
         except Exception as e:
             logger.exception(f"[Tool: notebook_duplicate_cell] FAILED - Unexpected error: {e}")
             raise RuntimeError(f"An unexpected error occurred while duplicating cells: {e}") from e
 
+    @tool
     async def notebook_execute_cell(
         self, notebook_path: str, cell_index: int, server_url: str = None, token: str = None
     ) -> List[dict]:
@@ -565,18 +611,13 @@ class CellToolsProvider:
             server_url = server_url.rstrip("/")
 
         try:
-            # Check if the path is allowed for security
-            if not os.path.isabs(notebook_path):
-                raise ValueError(f"Only absolute paths are allowed: {notebook_path}")
-
-            if not notebook_ops.is_path_allowed(notebook_path, self.config.allow_root_dirs):
-                raise PermissionError(f"Access denied: Path is outside the allowed workspace roots: {notebook_path}")
-
-            # First, validate that the notebook path is allowed and the cell exists
+            # read_notebook enforces the absolute-path and allowed-roots checks
+            # itself, so no separate pre-validation pass is needed here.
             nb = await notebook_ops.read_notebook(notebook_path, self.config.allow_root_dirs)
 
-            if not 0 <= cell_index < len(nb.cells):
-                raise IndexError(f"Cell index {cell_index} is out of bounds (0-{len(nb.cells) - 1}).")
+            num_cells = len(nb.cells)
+            if not 0 <= cell_index < num_cells:
+                raise IndexError(f"Cell index {cell_index} is out of bounds (0-{num_cells - 1}).")
 
             cell = nb.cells[cell_index]
             if cell.cell_type != "code":
@@ -584,27 +625,31 @@ class CellToolsProvider:
                     f"Cell {cell_index} is not a code cell (type: {cell.cell_type}). Only code cells can be executed."
                 )
 
-            # Create a cache key for this notebook/server combination
-            cache_key = (notebook_path, server_url, token)
-
-            # Check if we already have a kernel client for this notebook
-            if cache_key not in self._kernel_cache:
-                logger.debug(f"[Tool: notebook_execute_cell] Creating new kernel client for {notebook_path}")
+            # Create a cache key for this notebook/server combination.
+            # server_url is normalized above; token is normalized so an
+            # omitted token and an empty one share the same kernel.
+            cache_key = (notebook_path, server_url, token or "")
+
+            # Check if we already have a kernel client for this notebook.
+            # There is no await between this check and the cache store, so
+            # concurrent calls cannot race to start two kernels for one key.
+            kernel = self._kernel_cache.get(cache_key)
+            if kernel is None:
+                logger.debug("[Tool: notebook_execute_cell] Creating new kernel client for {}", notebook_path)
                 try:
                     kernel = KernelClient(server_url=server_url, token=token)
                     kernel.start()
                     self._kernel_cache[cache_key] = kernel
-                    logger.debug(f"[Tool: notebook_execute_cell] Kernel started successfully and cached")
+                    logger.debug("[Tool: notebook_execute_cell] Kernel started successfully and cached")
                 except Exception as e:
                     logger.error(f"[Tool: notebook_execute_cell] Failed to start kernel: {e}")
                     raise RuntimeError(f"Failed to connect to Jupyter kernel: {e}")
             else:
-                logger.debug(f"[Tool: notebook_execute_cell] Using cached kernel for {notebook_path}")
-                kernel = self._kernel_cache[cache_key]
+                logger.debug("[Tool: notebook_execute_cell] Using cached kernel for {}", notebook_path)
 
-            # Get the absolute path for the notebook to use with the websocket URL
-            abs_notebook_path = os.path.abspath(notebook_path)
-            notebook_relative_path = os.path.basename(abs_notebook_path)
+            # The path is already absolute (read_notebook rejects anything
+            # else), so the websocket URL only needs the basename.
+            notebook_relative_path = os.path.basename(notebook_path)
 
             try:
                 # Connect to the notebook
@@ -613,11 +658,11 @@ class CellToolsProvider:
                 )
                 notebook = NbModelClient(websocket_url)
                 await notebook.start()
-                logger.debug(f"[Tool: notebook_execute_cell] Connected to notebook at {websocket_url}")
+                logger.debug("[Tool: notebook_execute_cell] Connected to notebook at {}", websocket_url)
 
                 try:
                     # Execute the cell
-                    logger.debug(f"[Tool: notebook_execute_cell] Executing cell {cell_index}")
+                    logger.debug("[Tool: notebook_execute_cell] Executing cell {}", cell_index)
                     notebook.execute_cell(cell_index, kernel)
 
                     # Extract outputs
@@ -625,45 +670,14 @@ class CellToolsProvider:
                     outputs = ydoc._ycells[cell_index]["outputs"]
 
                     # Process outputs to ensure they're serializable and handle size limits
-                    processed_outputs = []
-                    for output in outputs:
-                        output_dict = dict(output)
-
-                        # Handle large data similar to notebook_read_cell_output
-                        if "data" in output_dict and isinstance(output_dict["data"], dict):
-                            for mime_type, data_content in output_dict["data"].items():
-                                if isinstance(data_content, str):
-                                    if len(data_content.encode("utf-8")) > self.config.max_cell_output_size:
-                                        if mime_type.startswith("image/"):
-                                            output_dict["data"][mime_type] = (
-                                                f"<image data too large: {len(data_content.encode('utf-8'))} bytes>"
-                                            )
-                                        else:
-                                            output_dict["data"][mime_type] = (
-                                                f"<data too large: {len(data_content.encode('utf-8'))} bytes, first 256 chars: {data_content[:256]}...>"
-                                            )
-                                        logger.warning(
-                                            f"[Tool: notebook_execute_cell] Truncated large data for mime_type '{mime_type}' in cell {cell_index}."
-                                        )
-
-                        elif "text" in output_dict and isinstance(output_dict["text"], (str, list)):
-                            text_content = output_dict["text"]
-                            if isinstance(text_content, list):
-                                text_content = "".join(text_content)
-
-                            if len(text_content.encode("utf-8")) > self.config.max_cell_output_size:
-                                output_dict["text"] = (
-                                    f"<text data too large: {len(text_content.encode('utf-8'))} bytes, first 256 chars: {text_content[:256]}...>"
-                                )
-                                logger.warning(
-                                    f"[Tool: notebook_execute_cell] Truncated large text output in cell {cell_index}."
-                                )
-
-                        processed_outputs.append(output_dict)
-
-                    logger.info(
-                        f"[Tool: notebook_execute_cell] SUCCESS - Executed cell {cell_index} and got {len(processed_outputs)} outputs.",
-                        tool_success=True,
+                    max_size = self.config.max_cell_output_size
+                    processed_outputs = [_process_output(output, max_size, cell_index) for output in outputs]
+
+                    _log_success(
+                        "notebook_execute_cell",
+                        "Executed cell {} and got {} outputs.",
+                        cell_index,
+                        len(processed_outputs),
                     )
                     return processed_outputs
                 finally:
@@ -11,10 +11,13 @@ import jsonschema
 
 # Import necessary components
 from ..core.config import ServerConfig
+from .registry import tool
 from ..core import notebook_ops  # Import the module directly
 
 
 class FileToolsProvider:
+    __slots__ = ("config",)
+
     # Update __init__ signature and body
     def __init__(self, config: ServerConfig):
         self.config = config
@@ -23,6 +26,7 @@ class FileToolsProvider:
         logger.debug("FileToolsProvider initialized.")
 
     # Update method calls to use imported functions
+    @tool
     async def notebook_create(self, notebook_path: str) -> str:
         """Creates a new, empty Jupyter Notebook (.ipynb) file at the specified path.
 
@@ -70,6 +74,7 @@ class FileToolsProvider:
             logger.exception(f"[Tool: notebook_create] FAILED - Unexpected error: {e}")
             raise RuntimeError(f"An unexpected error occurred during notebook creation: {e}") from e
 
+    @tool
     async def notebook_delete(self, notebook_path: str) -> str:
         """Deletes a Jupyter Notebook (.ipynb) file at the specified path.
 
@@ -110,6 +115,7 @@ class FileToolsProvider:
             logger.exception(f"[Tool: notebook_delete] FAILED - Unexpected error: {e}")
             raise RuntimeError(f"An unexpected error occurred during notebook deletion: {e}") from e
 
+    @tool
     async def notebook_rename(self, old_path: str, new_path: str) -> str:
         """Renames/Moves a Jupyter Notebook (.ipynb) file from one path to another.
 
@@ -166,6 +172,7 @@ class FileToolsProvider:
             logger.exception(f"[Tool: notebook_rename] FAILED - Unexpected error: {e}")
             raise RuntimeError(f"An unexpected error occurred during notebook rename: {e}") from e
 
+    @tool
     async def notebook_validate(self, notebook_path: str) -> str:
         """Validates a Jupyter Notebook file against the nbformat schema.
 
@@ -195,6 +202,7 @@ class FileToolsProvider:
             logger.exception(f"[Tool: notebook_validate] FAILED - Unexpected error during validation: {e}")
             raise RuntimeError(f"An unexpected error occurred during notebook validation: {e}") from e
 
+    @tool
     async def notebook_export(self, notebook_path: str, export_format: str, output_path: str) -> str:
         """Exports a Jupyter Notebook to a specified format using nbconvert.
 
@@ -6,16 +6,31 @@ from loguru import logger
 
 from ..core import notebook_ops
 from ..core.config import ServerConfig
+from .registry import tool
 from .tool_utils import (
     extract_code_outline,
     extract_markdown_outline,
     get_first_line_context,
 )
 
+# Expected error types shared by every tool handler in this module, kept in
+# one tuple instead of being re-spelled per except clause. (IOError covers
+# OSError and its file-related subclasses on Python 3.)
+_EXPECTED_TOOL_ERRORS = (
+    ValueError,
+    FileNotFoundError,
+    IndexError,
+    IOError,
+    PermissionError,
+    nbformat.validator.ValidationError,
+)
+
 
 class InfoToolsProvider:
     """Provides MCP tools for reading notebook information and content."""
 
+    __slots__ = ("config", "read_notebook", "is_path_allowed")
+
     def __init__(self, config: ServerConfig):
         self.config = config
         # Directly use imported notebook_ops functions
@@ -23,6 +38,7 @@ class InfoToolsProvider:
         self.is_path_allowed = notebook_ops.is_path_allowed
         logger.debug("InfoToolsProvider initialized.")
 
+    @tool
     async def notebook_read(self, notebook_path: str) -> dict:
         """Reads the entire content of a Jupyter Notebook file.
 
@@ -48,19 +64,14 @@ class InfoToolsProvider:
             # Return the notebook object directly (nbformat handles JSON compatibility)
             return nb
 
-        except (
-            PermissionError,
-            FileNotFoundError,
-            ValueError,
-            nbformat.validator.ValidationError,
-            IOError,
-        ) as e:
+        except _EXPECTED_TOOL_ERRORS as e:
             logger.error(f"[Tool: notebook_read] FAILED - {e}")
             raise
         except Exception as e:
             logger.exception(f"[Tool: notebook_read] FAILED - Unexpected error: {e}")
             raise RuntimeError(f"An unexpected error occurred while reading the notebook: {e}") from e
 
+    @tool
     async def notebook_read_cell(self, notebook_path: str, cell_index: int) -> str:
         """Reads the source content of a specific cell in a Jupyter Notebook.
 
@@ -90,20 +101,14 @@ class InfoToolsProvider:
             )
             return source
 
-        except (
-            PermissionError,
-            FileNotFoundError,
-            IndexError,
-            ValueError,
-            nbformat.validator.ValidationError,
-            IOError,
-        ) as e:
+        except _EXPECTED_TOOL_ERRORS as e:
             logger.error(f"[Tool: notebook_read_cell] FAILED - {e}")
             raise
         except Exception as e:
             logger.exception(f"[Tool: notebook_read_cell] FAILED - Unexpected error: {e}")
             raise RuntimeError(f"An unexpected error occurred while reading cell {cell_index}: {e}") from e
 
+    @tool
     async def notebook_get_cell_count(self, notebook_path: str) -> int:
         """Gets the total number of cells in a Jupyter Notebook.
 
@@ -122,19 +127,14 @@ class InfoToolsProvider:
                 tool_success=True,
             )
             return count
-        except (
-            PermissionError,
-            FileNotFoundError,
-            ValueError,
-            nbformat.validator.ValidationError,
-            IOError,
-        ) as e:
+        except _EXPECTED_TOOL_ERRORS as e:
             logger.error(f"[Tool: notebook_get_cell_count] FAILED - {e}")
             raise
         except Exception as e:
             logger.exception(f"[Tool: notebook_get_cell_count] FAILED - Unexpected error: {e}")
             raise RuntimeError(f"An unexpected error occurred while getting cell count: {e}") from e
 
+    @tool
     async def notebook_get_info(self, notebook_path: str) -> dict:
         """Gets basic information about a Jupyter Notebook file.
 
@@ -184,20 +184,14 @@ class InfoToolsProvider:
             )
             return info
 
-        except (
-            PermissionError,
-            FileNotFoundError,
-            ValueError,
-            nbformat.validator.ValidationError,
-            IOError,
-            OSError,
-        ) as e:
+        except _EXPECTED_TOOL_ERRORS as e:
             logger.error(f"[Tool: notebook_get_info] FAILED - {e}")
             raise
         except Exception as e:
             logger.exception(f"[Tool: notebook_get_info] FAILED - Unexpected error: {e}")
             raise RuntimeError(f"An unexpected error occurred while getting notebook info: {e}") from e
 
+    @tool
     async def notebook_get_outline(self, notebook_path: str) -> List[Dict[str, Union[int, str, List[str]]]]:
         """Generates a structural outline of the notebook (headings, function/class definitions).
 
@@ -258,19 +252,14 @@ class InfoToolsProvider:
             )
             return outline
 
-        except (
-            PermissionError,
-            FileNotFoundError,
-            ValueError,
-            nbformat.validator.ValidationError,
-            IOError,
-        ) as e:
+        except _EXPECTED_TOOL_ERRORS as e:
             logger.error(f"[Tool: notebook_get_outline] FAILED - {e}")
             raise
         except Exception as e:
             logger.exception(f"[Tool: notebook_get_outline] FAILED - Unexpected error generating outline: {e}")
             raise RuntimeError(f"An unexpected error occurred while generating the notebook outline: {e}") from e
 
+    @tool
     async def notebook_search(
         self, notebook_path: str, query: str, case_sensitive: bool = False
     ) -> List[Dict[str, Union[int, str]]]:
@@ -319,13 +308,7 @@ class InfoToolsProvider:
             )
             return matches
 
-        except (
-            PermissionError,
-            FileNotFoundError,
-            ValueError,
-            nbformat.validator.ValidationError,
-            IOError,
-        ) as e:
+        except _EXPECTED_TOOL_ERRORS as e:
             logger.error(f"[Tool: notebook_search] FAILED - {e}")
             raise
         except Exception as e:
@@ -3,11 +3,25 @@ from loguru import logger
 
 from ..core import notebook_ops
 from ..core.config import ServerConfig
+from .registry import tool
+
+# Expected error types for the metadata tools' except clauses; the four
+# handlers share one tuple rather than each rebuilding its own.
+_EXPECTED_TOOL_ERRORS = (
+    ValueError,
+    FileNotFoundError,
+    IndexError,
+    IOError,
+    PermissionError,
+    nbformat.validator.ValidationError,
+)
 
 
 class MetadataToolsProvider:
     """Provides tools for reading and writing notebook and cell metadata."""
 
+    __slots__ = ("config", "read_notebook", "write_notebook", "is_path_allowed")
+
     def __init__(self, config: ServerConfig):
         self.config = config
         self.read_notebook = notebook_ops.read_notebook
@@ -15,6 +29,7 @@ class MetadataToolsProvider:
         self.is_path_allowed = notebook_ops.is_path_allowed
         logger.debug("MetadataToolsProvider initialized.")
 
+    @tool
     async def notebook_read_metadata(self, notebook_path: str) -> dict:
         """Reads the top-level metadata of a Jupyter Notebook.
 
@@ -33,19 +48,14 @@ class MetadataToolsProvider:
                 tool_success=True,
             )
             return dict(metadata)  # Return a copy as a plain dict
-        except (
-            PermissionError,
-            FileNotFoundError,
-            ValueError,
-            nbformat.validator.ValidationError,
-            IOError,
-        ) as e:
+        except _EXPECTED_TOOL_ERRORS as e:
             logger.error(f"[Tool: notebook_read_metadata] FAILED - {e}")
             raise
         except Exception as e:
             logger.exception(f"[Tool: notebook_read_metadata] FAILED - Unexpected error: {e}")
             raise RuntimeError(f"An unexpected error occurred while reading notebook metadata: {e}") from e
 
+    @tool
     async def notebook_edit_metadata(self, notebook_path: str, metadata_updates: dict) -> str:
         """Updates the top-level metadata of a Jupyter Notebook.
 
@@ -59,47 +69,39 @@ class MetadataToolsProvider:
         """
         logger.debug(f"[Tool: notebook_edit_metadata] Called. Args: path={notebook_path}, updates={metadata_updates}")
         try:
-            nb = await self.read_notebook(notebook_path, self.config.allow_root_dirs)
-
-            # --- Metadata Size Check (Optional but recommended) ---
-            # Calculate potential size increase/decrease before modifying?
-            # Or just validate after modification before write.
-
-            for key, value in metadata_updates.items():
-                if value is None:
-                    if key in nb.metadata:
-                        del nb.metadata[key]
-                        logger.trace(f"[Tool: notebook_edit_metadata] Removed metadata key: {key}")
-                else:
-                    # Consider validating value type/size here if necessary
-                    nb.metadata[key] = value
-                    logger.trace(f"[Tool: notebook_edit_metadata] Updated metadata key: {key}")
-
-            # Validate size after update (if applicable, requires serializing)
-            # serialized_meta = json.dumps(nb.metadata)
-            # if len(serialized_meta.encode('utf-8')) > MAX_METADATA_SIZE:
-            #     raise ValueError("Updated metadata exceeds maximum allowed size.")
-
-            await self.write_notebook(notebook_path, nb, self.config.allow_root_dirs)
+            async with notebook_ops.mutate(notebook_path, self.config.allow_root_dirs) as nb:
+                # --- Metadata Size Check (Optional but recommended) ---
+                # Calculate potential size increase/decrease before modifying?
+                # Or just validate after modification before write.
+
+                for key, value in metadata_updates.items():
+                    if value is None:
+                        if key in nb.metadata:
+                            del nb.metadata[key]
+                            logger.trace(f"[Tool: notebook_edit_metadata] Removed metadata key: {key}")
+                    else:
+                        # Consider validating value type/size here if necessary
+                        nb.metadata[key] = value
+                        logger.trace(f"[Tool: notebook_edit_metadata] Updated metadata key: {key}")
+
+                # Validate size after update (if applicable, requires serializing)
+                # serialized_meta = json.dumps(nb.metadata)
+                # if len(serialized_meta.encode('utf-8')) > MAX_METADATA_SIZE:
+                #     raise ValueError("Updated metadata exceeds maximum allowed size.")
             logger.info(
                 f"[Tool: notebook_edit_metadata] SUCCESS - Updated notebook metadata for {notebook_path}.",
                 tool_success=True,
             )
             return "Successfully updated notebook metadata."
 
-        except (
-            PermissionError,
-            FileNotFoundError,
-            ValueError,
-            nbformat.validator.ValidationError,
-            IOError,
-        ) as e:
+        except _EXPECTED_TOOL_ERRORS as e:
             logger.error(f"[Tool: notebook_edit_metadata] FAILED - {e}")
             raise
         except Exception as e:
             logger.exception(f"[Tool: notebook_edit_metadata] FAILED - Unexpected error: {e}")
             raise RuntimeError(f"An unexpected error occurred while editing notebook metadata: {e}") from e
 
+    @tool
     async def notebook_read_cell_metadata(self, notebook_path: str, cell_index: int) -> dict:
         """Reads the metadata of a specific cell in a Jupyter Notebook.
 
@@ -124,20 +126,14 @@ class MetadataToolsProvider:
             )
             return dict(metadata)  # Return a copy as a plain dict
 
-        except (
-            PermissionError,
-            FileNotFoundError,
-            IndexError,
-            ValueError,
-            nbformat.validator.ValidationError,
-            IOError,
-        ) as e:
+        except _EXPECTED_TOOL_ERRORS as e:
             logger.error(f"[Tool: notebook_read_cell_metadata] FAILED - {e}")
             raise
         except Exception as e:
             logger.exception(f"[Tool: notebook_read_cell_metadata] FAILED - Unexpected error: {e}")
             raise RuntimeError(f"An unexpected error occurred while reading cell metadata: {e}") from e
 
+    @tool
     async def notebook_edit_cell_metadata(self, notebook_path: str, cell_index: int, metadata_updates: dict) -> str:
         """Updates the metadata of a specific cell in a Jupyter Notebook.
 
@@ -154,42 +150,33 @@ class MetadataToolsProvider:
             f"[Tool: notebook_edit_cell_metadata] Called. Args: path={notebook_path}, index={cell_index}, updates={metadata_updates}"
         )
         try:
-            nb = await self.read_notebook(notebook_path, self.config.allow_root_dirs)
-            if not 0 <= cell_index < len(nb.cells):
-                raise IndexError(f"Cell index {cell_index} is out of bounds (0-{len(nb.cells) - 1}).")
-
-            cell = nb.cells[cell_index]
-
-            # --- Metadata Size Check (Optional) ---
-            # Validate combined size or individual value sizes as needed.
-
-            for key, value in metadata_updates.items():
-                if value is None:
-                    if key in cell.metadata:
-                        del cell.metadata[key]
-                        logger.trace(f"[Tool: notebook_edit_cell_metadata] Removed cell metadata key: {key}")
-                else:
-                    # Consider validating value type/size here if necessary
-                    cell.metadata[key] = value
-                    logger.trace(f"[Tool: notebook_edit_cell_metadata] Updated cell metadata key: {key}")
-
-            # Validate overall cell size after update? (More complex)
-
-            await self.write_notebook(notebook_path, nb, self.config.allow_root_dirs)
+            async with notebook_ops.mutate(notebook_path, self.config.allow_root_dirs) as nb:
+                if not 0 <= cell_index < len(nb.cells):
+                    raise IndexError(f"Cell index {cell_index} is out of bounds (0-{len(nb.cells) - 1}).")
+
+                cell = nb.cells[cell_index]
+
+                # --- Metadata Size Check (Optional) ---
+                # Validate combined size or individual value sizes as needed.
+
+                for key, value in metadata_updates.items():
+                    if value is None:
+                        if key in cell.metadata:
+                            del cell.metadata[key]
+                            logger.trace(f"[Tool: notebook_edit_cell_metadata] Removed cell metadata key: {key}")
+                    else:
+                        # Consider validating value type/size here if necessary
+                        cell.metadata[key] = value
+                        logger.trace(f"[Tool: notebook_edit_cell_metadata] Updated cell metadata key: {key}")
+
+                # Validate overall cell size after update? (More complex)
             logger.info(
                 f"[Tool: notebook_edit_cell_metadata] SUCCESS - Updated metadata for cell {cell_index} in {notebook_path}.",
                 tool_success=True,
             )
             return f"Successfully updated metadata for cell {cell_index}."
 
-        except (
-            PermissionError,
-            FileNotFoundError,
-            IndexError,
-            ValueError,
-            nbformat.validator.ValidationError,
-            IOError,
-        ) as e:
+        except _EXPECTED_TOOL_ERRORS as e:
             logger.error(f"[Tool: notebook_edit_cell_metadata] FAILED - {e}")
             raise
         except Exception as e:
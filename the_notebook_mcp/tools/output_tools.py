@@ -9,11 +9,25 @@ from nbformat import NotebookNode
 
 from ..core import notebook_ops
 from ..core.config import ServerConfig
+from .registry import tool
+from . import tool_utils
+
+# Expected error types shared by the output tools' except clauses.
+_EXPECTED_TOOL_ERRORS = (
+    ValueError,
+    FileNotFoundError,
+    IndexError,
+    IOError,
+    PermissionError,
+    nbformat.validator.ValidationError,
+)
 
 
 class OutputToolsProvider:
     """Provides MCP tools for managing cell outputs."""
 
+    __slots__ = ("config", "read_notebook", "write_notebook", "is_path_allowed")
+
     def __init__(self, config: ServerConfig):
         self.config = config
         self.read_notebook = notebook_ops.read_notebook
@@ -21,6 +35,7 @@ class OutputToolsProvider:
         self.is_path_allowed = notebook_ops.is_path_allowed
         logger.debug("OutputToolsProvider initialized.")
 
+    @tool
     async def notebook_read_cell_output(self, notebook_path: str, cell_index: int) -> List[dict]:
         """Reads the output of a specific code cell.
 
@@ -52,23 +67,24 @@ class OutputToolsProvider:
                 if "data" in output_dict and isinstance(output_dict["data"], dict):
                     for mime_type, data_content in output_dict["data"].items():
                         if isinstance(data_content, str):
-                            if len(data_content.encode("utf-8")) > self.config.max_cell_output_size:
+                            if tool_utils.utf8_size_exceeds(data_content, self.config.max_cell_output_size):
+                                # Encode once, only on the truncation path.
+                                byte_size = len(data_content.encode("utf-8"))
                                 if mime_type.startswith("image/"):
-                                    output_dict["data"][mime_type] = (
-                                        f"<image data too large: {len(data_content.encode('utf-8'))} bytes>"
-                                    )
+                                    output_dict["data"][mime_type] = f"<image data too large: {byte_size} bytes>"
                                 else:
                                     output_dict["data"][mime_type] = (
-                                        f"<data too large: {len(data_content.encode('utf-8'))} bytes, first 256 chars: {data_content[:256]}...>"
+                                        f"<data too large: {byte_size} bytes, first 256 chars: {data_content[:256]}...>"
                                     )
                                 logger.warning(
                                     f"[Tool: notebook_read_cell_output] Truncated large data for mime_type '{mime_type}' in cell {cell_index}."
                                 )
                         elif isinstance(data_content, list):
                             data_as_str = "".join(data_content)
-                            if len(data_as_str.encode("utf-8")) > self.config.max_cell_output_size:
+                            if tool_utils.utf8_size_exceeds(data_as_str, self.config.max_cell_output_size):
+                                byte_size = len(data_as_str.encode("utf-8"))
                                 output_dict["data"][mime_type] = [
-                                    f"<stream data too large: {len(data_as_str.encode('utf-8'))} bytes, first 256 chars: {data_as_str[:256]}...>"
+                                    f"<stream data too large: {byte_size} bytes, first 256 chars: {data_as_str[:256]}...>"
                                 ]
                                 logger.warning(
                                     f"[Tool: notebook_read_cell_output] Truncated large stream data for mime_type '{mime_type}' in cell {cell_index}."
@@ -79,9 +95,10 @@ class OutputToolsProvider:
                     if isinstance(text_content, list):
                         text_content = "".join(text_content)
 
-                    if len(text_content.encode("utf-8")) > self.config.max_cell_output_size:
+                    if tool_utils.utf8_size_exceeds(text_content, self.config.max_cell_output_size):
+                        byte_size = len(text_content.encode("utf-8"))
                         output_dict["text"] = (
-                            f"<text data too large: {len(text_content.encode('utf-8'))} bytes, first 256 chars: {text_content[:256]}...>"
+                            f"<text data too large: {byte_size} bytes, first 256 chars: {text_content[:256]}...>"
                         )
                         logger.warning(
                             f"[Tool: notebook_read_cell_output] Truncated large text output in cell {cell_index}."
@@ -94,13 +111,7 @@ class OutputToolsProvider:
                 tool_success=True,
             )
             return processed_outputs
-        except (
-            PermissionError,
-            FileNotFoundError,
-            IndexError,
-            ValueError,
-            IOError,
-        ) as e:
+        except _EXPECTED_TOOL_ERRORS as e:
             logger.error(f"[Tool: notebook_read_cell_output] FAILED - {e}")
             raise
         except Exception as e:
@@ -109,6 +120,7 @@ class OutputToolsProvider:
                 f"An unexpected error occurred while reading cell outputs for cell {cell_index}: {e}"
             ) from e
 
+    @tool
     async def notebook_clear_cell_outputs(self, notebook_path: str, cell_index: int) -> str:
         """Clears the output(s) and execution count of a specific code cell.
 
@@ -123,57 +135,54 @@ class OutputToolsProvider:
         logger.debug(f"[Tool: notebook_clear_cell_outputs] Called. Args: path={notebook_path}, index={cell_index}")
         modified = False
         try:
-            nb = await self.read_notebook(notebook_path, self.config.allow_root_dirs)
-            if not 0 <= cell_index < len(nb.cells):
-                raise IndexError(f"Cell index {cell_index} is out of bounds (0-{len(nb.cells) - 1}).")
-
-            cell = nb.cells[cell_index]
-            if cell.cell_type == "code":
-                if "outputs" in cell and cell.outputs:
-                    cell.outputs = []
-                    modified = True
-                    logger.trace(
-                        f"[Tool: notebook_clear_cell_outputs] Cleared outputs for cell {cell_index} in {notebook_path}."
-                    )
-                if "execution_count" in cell and cell.execution_count is not None:
-                    cell.execution_count = None
-                    modified = True
-                    logger.trace(
-                        f"[Tool: notebook_clear_cell_outputs] Cleared execution count for cell {cell_index} in {notebook_path}."
-                    )
+            # edit_lock rather than mutate: the no-change paths below must
+            # return without rewriting the file.
+            async with notebook_ops.edit_lock(notebook_path):
+                nb = await self.read_notebook(notebook_path, self.config.allow_root_dirs)
+                if not 0 <= cell_index < len(nb.cells):
+                    raise IndexError(f"Cell index {cell_index} is out of bounds (0-{len(nb.cells) - 1}).")
+
+                cell = nb.cells[cell_index]
+                if cell.cell_type == "code":
+                    if "outputs" in cell and cell.outputs:
+                        cell.outputs = []
+                        modified = True
+                        logger.trace(
+                            f"[Tool: notebook_clear_cell_outputs] Cleared outputs for cell {cell_index} in {notebook_path}."
+                        )
+                    if "execution_count" in cell and cell.execution_count is not None:
+                        cell.execution_count = None
+                        modified = True
+                        logger.trace(
+                            f"[Tool: notebook_clear_cell_outputs] Cleared execution count for cell {cell_index} in {notebook_path}."
+                        )
 
-                if not modified:
-                    logger.debug(
-                        f"[Tool: notebook_clear_cell_outputs] Cell {cell_index} in {notebook_path} is a code cell but had no outputs or execution count to clear."
+                    if not modified:
+                        logger.debug(
+                            f"[Tool: notebook_clear_cell_outputs] Cell {cell_index} in {notebook_path} is a code cell but had no outputs or execution count to clear."
+                        )
+                        return f"Cell {cell_index} had no outputs or execution count to clear."
+                else:
+                    logger.warning(
+                        f"[Tool: notebook_clear_cell_outputs] Cell {cell_index} in {notebook_path} is not a code cell (type: {cell.cell_type}), skipping output clearing."
                     )
-                    return f"Cell {cell_index} had no outputs or execution count to clear."
-            else:
-                logger.warning(
-                    f"[Tool: notebook_clear_cell_outputs] Cell {cell_index} in {notebook_path} is not a code cell (type: {cell.cell_type}), skipping output clearing."
-                )
-                return f"Skipped: Cell {cell_index} is not a code cell."
+                    return f"Skipped: Cell {cell_index} is not a code cell."
 
-            await self.write_notebook(notebook_path, nb, self.config.allow_root_dirs)
+                await self.write_notebook(notebook_path, nb, self.config.allow_root_dirs)
             logger.info(
                 f"[Tool: notebook_clear_cell_outputs] SUCCESS - Cleared outputs for cell {cell_index} in {notebook_path}.",
                 tool_success=True,
             )
             return f"Successfully cleared outputs for cell {cell_index}."
 
-        except (
-            PermissionError,
-            FileNotFoundError,
-            IndexError,
-            ValueError,
-            nbformat.validator.ValidationError,
-            IOError,
-        ) as e:
+        except _EXPECTED_TOOL_ERRORS as e:
             logger.error(f"[Tool: notebook_clear_cell_outputs] FAILED - {e}")
             raise
         except Exception as e:
             logger.exception(f"[Tool: notebook_clear_cell_outputs] FAILED - Unexpected error: {e}")
             raise RuntimeError(f"An unexpected error occurred while clearing cell outputs: {e}") from e
 
+    @tool
     async def notebook_clear_all_outputs(self, notebook_path: str) -> str:
         """Clears all outputs and execution counts from all code cells in a notebook.
 
@@ -186,24 +195,28 @@ class OutputToolsProvider:
         logger.debug(f"[Tool: notebook_clear_all_outputs] Called. Args: path={notebook_path}")
         cleared_count = 0
         try:
-            nb = await self.read_notebook(notebook_path, self.config.allow_root_dirs)
-            for i, cell in enumerate(nb.cells):
-                if cell.cell_type == "code":
-                    cell_modified = False
-                    if "outputs" in cell and cell.outputs:
-                        cell.outputs = []
-                        cell_modified = True
-                    if "execution_count" in cell and cell.execution_count is not None:
-                        cell.execution_count = None
-                        cell_modified = True
-                    if cell_modified:
-                        cleared_count += 1
-                        logger.trace(
-                            f"[Tool: notebook_clear_all_outputs] Cleared outputs/exec_count for cell {i} in {notebook_path}."
-                        )
-
+            # edit_lock rather than mutate: a notebook with nothing to clear
+            # must be left untouched on disk.
+            async with notebook_ops.edit_lock(notebook_path):
+                nb = await self.read_notebook(notebook_path, self.config.allow_root_dirs)
+                for i, cell in enumerate(nb.cells):
+                    if cell.cell_type == "code":
+                        cell_modified = False
+                        if "outputs" in cell and cell.outputs:
+                            cell.outputs = []
+                            cell_modified = True
+                        if "execution_count" in cell and cell.execution_count is not None:
+                            cell.execution_count = None
+                            cell_modified = True
+                        if cell_modified:
+                            cleared_count += 1
+                            logger.trace(
+                                f"[Tool: notebook_clear_all_outputs] Cleared outputs/exec_count for cell {i} in {notebook_path}."
+                            )
+
+                if cleared_count > 0:
+                    await self.write_notebook(notebook_path, nb, self.config.allow_root_dirs)
             if cleared_count > 0:
-                await self.write_notebook(notebook_path, nb, self.config.allow_root_dirs)
                 logger.info(
                     f"[Tool: notebook_clear_all_outputs] SUCCESS - Cleared outputs for {cleared_count} code cells in {notebook_path}.",
                     tool_success=True,
@@ -215,13 +228,7 @@ class OutputToolsProvider:
                 )
                 return "No code cell outputs or execution counts to clear."
 
-        except (
-            PermissionError,
-            FileNotFoundError,
-            ValueError,
-            nbformat.validator.ValidationError,
-            IOError,
-        ) as e:
+        except _EXPECTED_TOOL_ERRORS as e:
             logger.error(f"[Tool: notebook_clear_all_outputs] FAILED - {e}")
             raise
         except Exception as e:
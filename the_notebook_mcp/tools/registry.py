@@ -0,0 +1,19 @@
+"""Explicit registration marker for MCP tool methods."""
+
+_TOOL_ATTR = "__mcp_tool__"
+
+
+def tool(func):
+    """Marks a provider coroutine as an MCP tool.
+
+    Methods are exported as tools because they carry this decorator, not
+    because their name happens to match a convention; the server-side
+    discovery just checks the marker.
+    """
+    setattr(func, _TOOL_ATTR, True)
+    return func
+
+
+def is_tool(member) -> bool:
+    """Returns True if the member was decorated with @tool."""
+    return getattr(member, _TOOL_ATTR, False) is True
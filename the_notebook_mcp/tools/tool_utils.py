@@ -56,3 +56,22 @@ def get_first_line_context(source: str, max_lines: int = 3) -> List[str]:
             if count >= max_lines:
                 break
     return context_lines
+
+
+# --- Size Validation Helpers ---
+
+
+def utf8_size_exceeds(s: str, limit: int) -> bool:
+    """Checks whether a string's UTF-8 encoding is larger than limit bytes.
+
+    Avoids materializing the encoded copy when the answer is decidable from
+    the character count alone: UTF-8 uses 1-4 bytes per character, so len(s)
+    is a lower bound on the encoded size and 4*len(s) an upper bound. Only
+    strings inside that window are actually encoded.
+    """
+    length = len(s)
+    if length > limit:
+        return True
+    if length * 4 <= limit:
+        return False
+    return len(s.encode("utf-8")) > limit